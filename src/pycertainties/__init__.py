@@ -1,10 +1,26 @@
 import numpy as np
 import sympy as sp
 
-from pycertainties.calculations import calculate, uncertainty
+from pycertainties.asynchronous import CalculationBatcher, calculate_async
+from pycertainties.calculations import CalculationReport, calculate, uncertainty
+from pycertainties.export import export_module
+from pycertainties.fitting import FitResult, polyfit
 from pycertainties.pprinting import pprint_calculation, pprint_uncertainty
-from pycertainties.strings import uncertainty_str
-from pycertainties.utilities import from_val_array, to_val_array, weighted_average
+from pycertainties.strings import uncertainty_str, uncertainty_strs
+from pycertainties.tables import write_table
+from pycertainties.utilities import (
+    from_val_array,
+    grouped_weighted_average,
+    split_vals,
+    to_val_array,
+    val_cumsum,
+    val_dot,
+    val_matmul,
+    val_mean,
+    val_sum,
+    val_ufunc,
+    weighted_average,
+)
 from pycertainties.val import Val
 
 # Setup numpy so that arrays of Vals print prettily
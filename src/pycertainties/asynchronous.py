@@ -0,0 +1,171 @@
+import asyncio
+import concurrent.futures
+import functools
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+import numpy as np
+from sympy.core.expr import Expr
+from sympy.parsing.sympy_parser import parse_expr
+
+from pycertainties.calculations import (
+    BACKENDS,
+    IterableValOrReal,
+    ListValOrReal,
+    _calculate_arrays,
+    _check_symbols,
+    _prepare,
+)
+from pycertainties.val import Real, Val
+
+Prepared = Tuple[Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]], Tuple[int, ...], Callable[[Val], Any]]
+
+
+class CalculationBatcher:
+    """
+    Performs calculate(...) from asyncio code without blocking the event loop.
+
+    Calculations run in an executor (the event loop's default executor if None). Calculations of the same equation
+    with the same symbols that are requested within "window" seconds of each other are combined into a single
+    vectorized evaluation, up to max_batch_size calculations at a time, and each caller receives its own result.
+    Calculations are only batched with others from the same event loop, so a batcher may be shared between threads
+    each running their own event loop.
+
+    Example)
+        batcher = CalculationBatcher()
+        await asyncio.gather(
+            batcher.calculate("x*y + z", x=Val(3, 0.1), y=Val(3, 1), z=4),
+            batcher.calculate("x*y + z", x=Val(3, 0.1), y=[Val(3, 1), [Val(5, 1)]], z=4),
+        ) == [Val(13.0, 3.0149626863362666), [Val(13.0, 3.0149626863362666), [Val(19.0, 3.0413812651491092)]]]
+    """
+
+    def __init__(
+        self,
+        window: float = 0.002,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_batch_size: int = 1024,
+    ):
+        self.window = window
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[Hashable, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        self._timers: Dict[Hashable, asyncio.TimerHandle] = {}
+
+    async def calculate(
+        self, expr: Union[str, Expr], *, backend: str = "symbolic", **values: Union[Val, Real, IterableValOrReal]
+    ) -> Union[Val, ListValOrReal]:
+        """
+        Calculates the same result as calculate(expr, backend=backend, **values), batched with any other calculations
+        of the same equation. Correlated values are not supported.
+        """
+        if isinstance(expr, str):
+            expr = _parse(expr)
+        _check_symbols(expr, ("backend",))
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend must be one of {', '.join(BACKENDS)}.")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (loop, expr, backend, tuple(sorted(values)))
+        batch = self._pending.setdefault(key, [])
+        batch.append((values, future))
+        if len(batch) >= self.max_batch_size:
+            self._flush(key)
+        elif len(batch) == 1:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+        return await future
+
+    def _flush(self, key: Tuple[asyncio.AbstractEventLoop, Expr, str, Tuple[str, ...]]) -> None:
+        """Private method starting the evaluation of all pending calculations with the given key"""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        requests = self._pending.pop(key, None)
+        if not requests:
+            return
+
+        loop, expr, backend, _ = key
+        evaluation = loop.run_in_executor(
+            self.executor, _calculate_batch, expr, backend, [values for values, _ in requests]
+        )
+        evaluation.add_done_callback(functools.partial(_resolve, [future for _, future in requests]))
+
+
+_DEFAULT_BATCHER = CalculationBatcher()
+
+
+async def calculate_async(
+    expr: Union[str, Expr], *, backend: str = "symbolic", **values: Union[Val, Real, IterableValOrReal]
+) -> Union[Val, ListValOrReal]:
+    """
+    Calculates the same result as calculate(...) in the event loop's default executor, batching concurrent
+    calculations of the same equation together. See CalculationBatcher for more control over batching.
+    """
+    return await _DEFAULT_BATCHER.calculate(expr, backend=backend, **values)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse(expr: str) -> Expr:
+    """Private function caching parsed equations"""
+    return parse_expr(expr)
+
+
+def _resolve(futures: List[asyncio.Future], evaluation: asyncio.Future) -> None:
+    """Private function setting the result of each calculation in a batch once it has been evaluated"""
+    if evaluation.cancelled():
+        results: List[Any] = [asyncio.CancelledError()] * len(futures)
+    elif evaluation.exception() is not None:
+        results = [evaluation.exception()] * len(futures)
+    else:
+        results = evaluation.result()
+    for future, result in zip(futures, results):
+        if future.done():
+            continue
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+def _calculate_batch(
+    expr: Expr, backend: str, requests: List[Dict[str, Any]]
+) -> List[Union[Val, ListValOrReal, Exception]]:
+    """
+    Private function calculating the result of each of a group of calculations of the same expression and symbols,
+    by flattening every calculation's values into a single array per symbol and evaluating them all at once. Any
+    calculations whose values are invalid are returned as the exceptions they raised.
+    """
+    prepared: List[Union[Prepared, Exception]] = []
+    for values in requests:
+        try:
+            prepared.append(_prepare(values))
+        except Exception as error:  # pylint: disable=W0703
+            prepared.append(error)
+    valid: List[Prepared] = [item for item in prepared if not isinstance(item, Exception)]
+    if not valid:
+        return prepared  # type: ignore
+
+    sizes = [int(np.prod(shape)) for _, shape, _ in valid]
+    merged = {}
+    for key in valid[0][0]:
+        uncertainties = [split[key][1] for split, _, _ in valid]
+        merged[key] = (
+            np.concatenate([np.broadcast_to(split[key][0], shape).ravel() for split, shape, _ in valid]),
+            (
+                np.concatenate(
+                    [
+                        np.broadcast_to(0.0 if item is None else item, shape).ravel()
+                        for item, (_, shape, _) in zip(uncertainties, valid)
+                    ]
+                )
+                if any(item is not None for item in uncertainties)
+                else None
+            ),
+        )
+    result = _calculate_arrays(expr, merged, backend)
+    value, uncertainty = np.asarray(result.value), np.asarray(result.uncertainty)
+
+    results = iter(
+        rebuild(Val(value[start:end], uncertainty[start:end]))
+        for (_, _, rebuild), start, end in zip(valid, np.cumsum([0] + sizes[:-1]), np.cumsum(sizes))
+    )
+    return [item if isinstance(item, Exception) else next(results) for item in prepared]
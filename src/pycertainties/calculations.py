@@ -1,6 +1,11 @@
-from typing import Dict, Iterable, List, Union
+import functools
+import itertools
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Literal, NamedTuple, Optional, Sequence, Tuple, Union, overload
 
+import numpy as np
 import sympy as sp
+from numpy.typing import ArrayLike
 from sympy.core.expr import Expr
 from sympy.parsing.sympy_parser import parse_expr
 
@@ -10,6 +15,41 @@ from pycertainties.val import Real, Val
 IterableValOrReal = Iterable[Union["Val", Real, "IterableValOrReal"]]  # type: ignore
 ListValOrReal = List[Union["Val", Real, "ListValOrReal"]]  # type: ignore
 
+BACKENDS = ("symbolic", "numeric")
+OPTIONS = ("backend", "correlation", "covariance", "report")
+COMPLEX_STEP = 1e-20
+# Roughly the cube root of np.float64's machine epsilon, which minimizes the error of central differences
+CENTRAL_STEP = 6e-6
+# Functions which are not complex-analytic, or have no complex implementation in numpy, so that their derivatives
+# can't be found with the complex-step method
+NON_ANALYTIC = (
+    sp.Abs,
+    sp.Min,
+    sp.Max,
+    sp.atan2,
+    sp.floor,
+    sp.ceiling,
+    sp.frac,
+    sp.sign,
+    sp.Heaviside,
+    sp.Mod,
+    sp.Piecewise,
+    sp.re,
+    sp.im,
+    sp.arg,
+    sp.conjugate,
+)
+FUNCTION = sp.Symbol("f(...)")
+FUNCTION_UNCERTAINTY = sp.Symbol("δf(...)")
+
+
+class _Correlation(NamedTuple):
+    """Private type holding a correlation or covariance matrix and the names of the values it's between"""
+
+    names: Sequence[str]
+    matrix: np.ndarray
+    covariance: bool
+
 
 def uncertainty(expr: Union[str, Expr], *variables: str) -> Expr:
     """
@@ -32,42 +72,296 @@ def uncertainty(expr: Union[str, Expr], *variables: str) -> Expr:
     )
 
 
-def calculate(expr: Union[str, Expr], **values: Union["Val", Real, IterableValOrReal]) -> Union["Val", ListValOrReal]:
+@overload
+def calculate(
+    expr: Union[str, Expr],
+    *,
+    backend: str = ...,
+    correlation: Optional[Tuple[Sequence[str], ArrayLike]] = ...,
+    covariance: Optional[Tuple[Sequence[str], ArrayLike]] = ...,
+    report: Literal[False] = ...,
+    **values: Union["Val", Real, IterableValOrReal],
+) -> Union["Val", ListValOrReal]:
+    ...
+
+
+@overload
+def calculate(
+    expr: Union[str, Expr],
+    *,
+    backend: str = ...,
+    correlation: Optional[Tuple[Sequence[str], ArrayLike]] = ...,
+    covariance: Optional[Tuple[Sequence[str], ArrayLike]] = ...,
+    report: Literal[True],
+    **values: Union["Val", Real, IterableValOrReal],
+) -> "CalculationReport":
+    ...
+
+
+def calculate(
+    expr: Union[str, Expr],
+    *,
+    backend: str = "symbolic",
+    correlation: Optional[Tuple[Sequence[str], ArrayLike]] = None,
+    covariance: Optional[Tuple[Sequence[str], ArrayLike]] = None,
+    report: bool = False,
+    **values: Union["Val", Real, IterableValOrReal],
+) -> Union["Val", ListValOrReal, "CalculationReport"]:
     """
     Given either a string representation of an equation or sympy expression, and keys corresponding to each symbol in
     the eqtn/expr mapped to values of the symbols, calculates and returns result of that equation.
 
     Each value may either be a:
         1) int/float
-        2) A Val object
+        2) A Val object, whose value and uncertainty may be numpy arrays of the same shape
         3) An iterable of more iterables or Val objects
 
-    All iterable values must be of the same shape. The return type depends on if there were any iterable values.
+    Iterable values that are regularly shaped (numpy arrays, or nested lists that could be one) follow numpy's
+    broadcasting rules, so a (N, 1) array for one symbol and a (1, M) array for another gives a (N, M) result without
+    the inputs ever being expanded. Ragged iterables must all be of exactly the same shape, or a ValueError is raised;
+    they are flattened once, calculated in a single vectorized pass and rebuilt into the original nesting. The return
+    type depends on if there were any iterable values.
         1) If there were no iterable values
-            - A single Val object with the result
-        2) If there were any iterable values (all of the same shape)
-            - A list of the same shape as the iterables with scalers of Val types
+            - A single Val object with the result. If any Vals stored numpy arrays, its value and uncertainty are
+              numpy arrays with the broadcast shape of the inputs.
+        2) If there were any iterable values
+            - A list of the same (or broadcast) shape as the iterables with scalers of Val types
+
+    The backend determines how the partial derivatives of the equation are found.
+        1) "symbolic"
+            - The uncertainty equation is derived with uncertainty(...) and evaluated
+        2) "numeric"
+            - Only the equation itself is evaluated, and its partial derivatives are found numerically using the
+              complex-step method, which is exact to floating point precision for analytic functions. This avoids
+              sympy's differentiation entirely, which is much faster for very large equations. Equations using any
+              of the functions in NON_ANALYTIC, such as Abs(...), Min(...) or atan2(...), fall back to central
+              differences, which are accurate to roughly 10 significant digits.
+
+    By default all values are assumed to be independent. Correlated values can be given as a tuple of their symbols and
+    either a correlation matrix or a covariance matrix between them, in the same order. A covariance matrix replaces
+    the uncertainties of its symbols (which may then be given as int/floats). Either matrix may have leading
+    dimensions, giving a separate matrix for each element of the broadcast array values. The uncertainty is then
+    calculated as:
+        δf = √(J C Jᵀ)
+    where J are the partial derivatives of the equation and C is the covariance matrix of all values.
+
+    If report is True, a CalculationReport holding the equation, its uncertainty equation and the result is returned
+    instead of just the result.
+
+    As the options backend, correlation, covariance and report share their names with the keyword arguments of values,
+    an equation with a symbol of the same name as an option raises a ValueError.
 
     Example)
         calculate("x*y + z", x=Val(3, 0.1), y=Val(3, 1), z=4) == Val(13.0, 3.0149626863362666)
 
         calculate("x*y + z", x=Val(3, 0.1), y=[Val(3, 1), [Val(5, 1)]], z=4)
             == [Val(13.0, 3.0149626863362666), [Val(19.0, 3.0413812651491092)]]
+
+        calculate("x*y", x=[[Val(1, 0.1)], [Val(2, 0.1)]], y=[[3, 4]])
+            == [[Val(3.0, 0.3), Val(4.0, 0.4)], [Val(6.0, 0.3), Val(8.0, 0.4)]]
+
+        calculate("x - y", x=Val(3, 0.1), y=Val(1, 0.1), correlation=(("x", "y"), [[1, 0.5], [0.5, 1]]))
+            == Val(2.0, 0.1)
     """
     if isinstance(expr, str):
         expr = parse_expr(expr)
+    _check_symbols(expr, OPTIONS)
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend must be one of {', '.join(BACKENDS)}.")
+    if not isinstance(report, bool):
+        raise ValueError("Report must be either True or False.")
+    if correlation is not None and covariance is not None:
+        raise ValueError("Only one of a correlation or covariance matrix may be given.")
+    correlated = (
+        _Correlation(correlation[0], np.asarray(correlation[1], dtype=np.float64), False)
+        if correlation is not None
+        else (
+            _Correlation(covariance[0], np.asarray(covariance[1], dtype=np.float64), True)
+            if covariance is not None
+            else None
+        )
+    )
+    if correlated is not None:
+        _check_correlation(correlated, values)
+
+    result, uncertain = _calculate_any(expr, values, backend, correlated)
+    if report:
+        if correlated is not None and correlated.covariance:
+            uncertain = tuple(key for key in values if key in uncertain or key in correlated.names)
+        correlated_names = tuple(correlated.names) if correlated is not None else ()
+        return CalculationReport(expr, uncertain, correlated_names, result)
+    return result
+
+
+@dataclass
+class CalculationReport:
+    """
+    The result of a calculation along with the equation and uncertainty equation it was calculated from, as returned by
+    calculate(..., report=True).
+
+    The uncertainty equation is derived only when first needed (it is cached from the calculation itself by the
+    symbolic backend), and the pretty, LaTeX and plain renderings are each created once when first accessed.
+
+    Example)
+        print(calculate("x*y + z", x=Val(3, 0.1), y=Val(3, 3), z=4, report=True).plain) ->
+            f(...) = x*y + z
+                -> 13.0
+            δf(...) = sqrt(x**2*δy**2 + y**2*δx**2)
+                -> 9.004998611882181
+    """
+
+    expr: Expr
+    variables: Tuple[str, ...]
+    correlated: Tuple[str, ...]
+    result: Union[Val, ListValOrReal]
+
+    @functools.cached_property
+    def uncertainty_expr(self) -> Expr:
+        return _uncertainty_expr(self.expr, self.variables, self.correlated)
+
+    @functools.cached_property
+    def value(self) -> Union[Real, np.ndarray, ListValOrReal]:
+        if isinstance(self.result, Val):
+            return self.result.value
+        return utils.operate_recursive(lambda val: float(val.value), self.result)  # type: ignore
+
+    @functools.cached_property
+    def uncertainty(self) -> Union[Real, np.ndarray, ListValOrReal]:
+        if isinstance(self.result, Val):
+            return self.result.uncertainty
+        return utils.operate_recursive(lambda val: float(val.uncertainty), self.result)  # type: ignore
+
+    @functools.cached_property
+    def pretty(self) -> str:
+        return (
+            f"{sp.pretty(sp.Eq(FUNCTION, self.expr))}\n\t-> {self.value}\n"
+            f"{sp.pretty(sp.Eq(FUNCTION_UNCERTAINTY, self.uncertainty_expr))}\n\t-> {self.uncertainty}\n"
+        )
+
+    @functools.cached_property
+    def latex(self) -> str:
+        symbol_names = {FUNCTION: "f", FUNCTION_UNCERTAINTY: "\\delta f"}
+        symbol_names.update(
+            {
+                sym: "\\delta " + sp.latex(sp.Symbol(sym.name[1:]))
+                for sym in self.uncertainty_expr.free_symbols
+                if sym.name.startswith("δ")
+            }
+        )
+        symbol_names.update(
+            {
+                sym: sp.latex(sp.Symbol("rho" + sym.name[1:]))
+                for sym in self.uncertainty_expr.free_symbols
+                if sym.name.startswith("ρ")
+            }
+        )
+        expr = sp.latex(sp.Eq(FUNCTION, self.expr), symbol_names=symbol_names)
+        uncertainty_expr = sp.latex(sp.Eq(FUNCTION_UNCERTAINTY, self.uncertainty_expr), symbol_names=symbol_names)
+        return (
+            "\\begin{aligned}\n"
+            f"{expr.replace('=', '&=', 1)} \\rightarrow {self.value} \\\\\n"
+            f"{uncertainty_expr.replace('=', '&=', 1)} \\rightarrow {self.uncertainty}\n"
+            "\\end{aligned}"
+        )
+
+    @functools.cached_property
+    def plain(self) -> str:
+        return (
+            f"{FUNCTION} = {self.expr}\n\t-> {self.value}\n"
+            f"{FUNCTION_UNCERTAINTY} = {self.uncertainty_expr}\n\t-> {self.uncertainty}\n"
+        )
+
+    def __str__(self) -> str:
+        return self.plain
 
+    def _repr_latex_(self) -> str:
+        return f"${self.latex}$"
+
+
+def _check_correlation(correlation: _Correlation, names: Iterable[str]) -> None:
+    """Private function raising a ValueError if a correlation or covariance matrix doesn't fit the given values"""
+    kind = "Covariance" if correlation.covariance else "Correlation"
+    if any(name not in names for name in correlation.names):
+        raise ValueError(f"{kind} matrix has values which were not given.")
+    if correlation.matrix.shape[-2:] != (len(correlation.names), len(correlation.names)):
+        raise ValueError(f"{kind} matrix must be square with one row per correlated value.")
+    if not np.allclose(correlation.matrix, np.swapaxes(correlation.matrix, -1, -2)):
+        raise ValueError(f"{kind} matrix must be symmetric.")
+
+
+def _check_symbols(expr: Expr, options: Iterable[str]) -> None:
+    """Private function raising a ValueError if any symbol of an expression has the same name as an option"""
+    reserved = sorted(sym.name for sym in expr.free_symbols if sym.name in options)
+    if reserved:
+        raise ValueError(f"Symbols may not be named {', '.join(reserved)}, as these are the names of options.")
+
+
+def _calculate_any(
+    expr: Expr, values: Dict[str, Union[Val, Real, IterableValOrReal]], backend: str, correlated: Optional[_Correlation]
+) -> Tuple[Union[Val, ListValOrReal], Tuple[str, ...]]:
+    """
+    Private function performing the calculations of calculate(...) once its arguments have been validated. Returns the
+    result along with the names of the values that had uncertainties, as found while preparing them, so that iterables
+    which can only be iterated over once are never iterated over again.
+    """
+    # pylint: disable=W1116
+    any_arrays = any(
+        isinstance(value, Iterable) or (isinstance(value, Val) and np.ndim(value.value)) for value in values.values()
+    )
+    if backend == "symbolic" and correlated is None and not any_arrays:
+        uncertain = tuple(key for key, value in values.items() if isinstance(value, Val))
+        return _calculate(expr, **values), uncertain  # type: ignore
+
+    split, _, rebuild = _prepare(values)
+    uncertain = tuple(key for key, (_, uncertainties) in split.items() if uncertainties is not None)
+    return rebuild(_calculate_arrays(expr, split, backend, correlated)), uncertain
+
+
+def _prepare(
+    values: Dict[str, Union[Val, Real, IterableValOrReal]]
+) -> Tuple[Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]], Tuple[int, ...], Callable[[Val], Any]]:
+    """
+    Private function converting the values of a calculation to value and uncertainty arrays (see _split(...)), along
+    with the shape of the calculation and a function converting the calculated Val of arrays, either of that shape or
+    flattened, to the result calculate(...) returns.
+
+    Regularly shaped iterables are broadcast against each other. Ragged iterables are flattened, and must all be of
+    exactly the same shape, or a ValueError is raised.
+    """
     # pylint: disable=W1116
-    constants = {key: value for key, value in values.items() if not isinstance(value, Iterable)}
     iterables = {key: value for key, value in values.items() if isinstance(value, Iterable)}
+    arrays = {key: _to_object_array(value) for key, value in iterables.items()}
+
+    if any(array is None for array in arrays.values()):
+        leaves: List[List[Union[Val, Real]]] = []
+
+        def index(*lists: List[Union[Val, Real]]) -> range:
+            leaves.extend(lists)
+            return range(len(lists[0]))
 
-    if any(iterables):
-        return utils.operate_recursive(
-            lambda *items: _calculate(expr, **dict(zip(iterables.keys(), items)), **constants),
-            *iterables.values(),
+        indices = utils.operate_flat(index, *iterables.values())
+        arrays = {key: _leaves_array(items) for key, items in zip(iterables, leaves)}
+        return (
+            {key: _split(arrays.get(key, value)) for key, value in values.items()},  # type: ignore
+            (len(leaves[0]),),
+            lambda result: utils.operate_recursive(
+                utils.to_val_array(result.value, result.uncertainty).__getitem__, indices  # type: ignore
+            ),
         )
-    else:
-        return _calculate(expr, **constants)
+
+    split = {key: _split(arrays.get(key, value)) for key, value in values.items()}  # type: ignore
+    shape = np.broadcast_shapes(*(array.shape for array, _ in split.values()))
+    if iterables:
+        return (
+            split,
+            shape,
+            lambda result: utils.to_val_array(
+                np.reshape(result.value, shape), np.reshape(result.uncertainty, shape)
+            ).tolist(),
+        )
+    if shape:
+        return split, shape, lambda result: Val(np.reshape(result.value, shape), np.reshape(result.uncertainty, shape))
+    return split, shape, lambda result: Val(np.asarray(result.value).item(), np.asarray(result.uncertainty).item())
 
 
 def _calculate(expr: Union[str, Expr], **values: Union[Val, Real]) -> Val:
@@ -77,12 +371,12 @@ def _calculate(expr: Union[str, Expr], **values: Union[Val, Real]) -> Val:
     if isinstance(expr, str):
         expr = parse_expr(expr)
 
-    uncertainty_expr = uncertainty(expr, *(key for key, value in values.items() if isinstance(value, Val)))
+    uncertainty_expr = _uncertainty_expr(expr, tuple(key for key, value in values.items() if isinstance(value, Val)))
     to_sub = _substitution_map(**values)
     return Val(float(expr.subs(to_sub).evalf()), float(uncertainty_expr.subs(to_sub).evalf()))
 
 
-def _substitution_map(**values: Union[Val, Real]) -> Dict[str, Real]:
+def _substitution_map(**values: Union[Val, Real]) -> Dict[str, Union[Real, np.ndarray]]:
     """
     Given string keys mapping to int/float/Val values, creates a map where:
         1) If the value is an int/float
@@ -99,3 +393,225 @@ def _substitution_map(**values: Union[Val, Real]) -> Dict[str, Real]:
         else:
             to_sub[sym] = val
     return to_sub
+
+
+def _to_object_array(iterable: IterableValOrReal) -> Optional[np.ndarray]:
+    """
+    Converts a regularly shaped iterable of Vals and int/floats to a numpy array, or returns None if it is ragged.
+    """
+    if isinstance(iterable, np.ndarray) and iterable.dtype != object:
+        return iterable
+    try:
+        array = np.array(iterable, dtype=object)
+    except ValueError:
+        return None
+    if any(isinstance(item, Iterable) for item in array.flat):  # pylint: disable=W1116
+        return None
+    return array
+
+
+def _leaves_array(leaves: List[Union[Val, Real]]) -> np.ndarray:
+    """Converts a flat list of Vals and int/floats to a one-dimensional numpy array"""
+    array = np.empty(len(leaves), dtype=object)
+    array[:] = leaves
+    return array
+
+
+def _split(value: Union[Val, Real, np.ndarray]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Splits a Val, int/float or numpy array of either into float64 arrays of its values and uncertainties. The
+    uncertainties are None if there were no Vals at all, so that the value is treated as a constant.
+    """
+    if isinstance(value, Val):
+        return np.asarray(value.value, dtype=np.float64), np.asarray(value.uncertainty, dtype=np.float64)
+    if not isinstance(value, np.ndarray) or value.dtype != object:
+        return np.asarray(value, dtype=np.float64), None
+
+    values = np.zeros(value.shape)
+    uncertainties = np.zeros(value.shape)
+    any_vals = False
+    for ind in np.ndindex(value.shape):
+        item = value[ind]
+        if isinstance(item, Val):
+            values[ind], uncertainties[ind] = item.value, item.uncertainty
+            any_vals = True
+        else:
+            values[ind] = item
+    return values, (uncertainties if any_vals else None)
+
+
+def _calculate_arrays(
+    expr: Expr,
+    split: Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]],
+    backend: str = "symbolic",
+    correlation: Optional[_Correlation] = None,
+) -> Val:
+    """
+    Evaluates an expression and its uncertainty in a single vectorized pass over the broadcast shape of the given
+    value and uncertainty arrays, returning a Val of arrays. Values without uncertainties are treated as constants, as
+    are the elements of arrays whose uncertainty is 0, even where the partial derivative is infinite.
+    """
+    if correlation is not None and correlation.covariance:
+        split, correlation = _from_covariance(split, correlation)
+    shape = np.broadcast_shapes(*(values.shape for values, _ in split.values()))
+    free_symbols = {sym.name: sym for sym in expr.free_symbols}
+    symbols = tuple(free_symbols.get(key, sp.Symbol(key)) for key in split)
+    arguments = [values for values, _ in split.values()]
+    uncertain = tuple(key for key, (_, uncertainties) in split.items() if uncertainties is not None)
+    any_exact = any(np.any(split[key][1] == 0) for key in uncertain)
+
+    if backend == "symbolic" and correlation is None and not any_exact:
+        value = _lambdify(symbols, expr)(*arguments)
+        uncertainty_value: Union[float, np.ndarray] = _uncertainty_function(symbols, expr, uncertain)(
+            *arguments, *(split[key][1] for key in uncertain)
+        )
+    else:
+        if backend == "numeric":
+            value, derivatives = _derivatives_numeric(
+                _lambdify(symbols, expr, cse=True), split, complex_step=not expr.has(*NON_ANALYTIC)
+            )
+        else:
+            value = _lambdify(symbols, expr)(*arguments)
+            with np.errstate(divide="ignore"):
+                derivatives = {
+                    key: function(*arguments)
+                    for key, function in zip(uncertain, _derivative_functions(symbols, expr, uncertain))
+                }
+        # Elements without an uncertainty contribute nothing, rather than 0*inf where the derivative is infinite
+        with np.errstate(invalid="ignore"):
+            weighted = [
+                np.where(split[key][1] == 0, 0.0, derivatives[key] * split[key][1]) for key in uncertain  # type: ignore
+            ]
+        uncertainty_value = _propagate(weighted, list(uncertain), correlation)
+    return Val(
+        np.broadcast_to(value, shape).astype(np.float64),
+        np.broadcast_to(uncertainty_value, shape).astype(np.float64),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _lambdify(symbols: Tuple[sp.Symbol, ...], expr: Expr, cse: bool = False) -> Callable[..., np.ndarray]:
+    """
+    Private function returning a numpy function of an expression. Functions are cached, so that repeatedly calculating
+    the same expression doesn't repeat any work in sympy.
+    """
+    return sp.lambdify(symbols, expr, "numpy", cse=cse)
+
+
+def _uncertainty_expr(expr: Expr, uncertain: Iterable[str], correlated: Iterable[str] = ()) -> Expr:
+    """
+    Private function returning the cached uncertainty(...) of an expression. If any uncertain values are correlated,
+    the expression includes a term 2*ρ_a,b*(df/da*δa)*(df/db*δb) for each pair of correlated values a and b.
+
+    The names are sorted before looking up the cache, so that a calculation and its report share a single derivation
+    no matter what order the values were given in.
+    """
+    return _sorted_uncertainty_expr(expr, tuple(sorted(uncertain)), tuple(sorted(correlated)))
+
+
+@functools.lru_cache(maxsize=256)
+def _sorted_uncertainty_expr(expr: Expr, uncertain: Tuple[str, ...], correlated: Tuple[str, ...]) -> Expr:
+    """Private function deriving the expression returned by _uncertainty_expr(...) from sorted names"""
+    if not correlated:
+        return uncertainty(expr, *uncertain)
+
+    free_symbols = {sym.name: sym for sym in expr.free_symbols}
+    weighted = {
+        key: sp.diff(expr, free_symbols[key]) * sp.Symbol("δ" + key) for key in uncertain if key in free_symbols
+    }
+    pairs = itertools.combinations((key for key in correlated if key in weighted), 2)
+    return sp.sqrt(
+        sum(term ** 2 for term in weighted.values())
+        + sum(2 * sp.Symbol(f"ρ_{a},{b}") * weighted[a] * weighted[b] for a, b in pairs)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _uncertainty_function(
+    symbols: Tuple[sp.Symbol, ...], expr: Expr, uncertain: Tuple[str, ...]
+) -> Callable[..., np.ndarray]:
+    """
+    Private function returning a cached numpy function of the uncertainty of an expression, taking the symbols followed
+    by the uncertainty of each uncertain symbol.
+    """
+    return _lambdify(symbols + tuple(sp.Symbol("δ" + key) for key in uncertain), _uncertainty_expr(expr, uncertain))
+
+
+@functools.lru_cache(maxsize=256)
+def _derivative_functions(
+    symbols: Tuple[sp.Symbol, ...], expr: Expr, uncertain: Tuple[str, ...]
+) -> Tuple[Callable[..., np.ndarray], ...]:
+    """Private function returning cached numpy functions of the partial derivatives of an expression"""
+    return tuple(_lambdify(symbols, sp.diff(expr, symbol)) for symbol in symbols if symbol.name in uncertain)
+
+
+def _derivatives_numeric(
+    function: Callable[..., np.ndarray],
+    split: Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]],
+    complex_step: bool = True,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Given a vectorized function of every value, returns its value and its partial derivative with respect to each value
+    with an uncertainty, found using either the complex-step method or, for functions that aren't complex-analytic,
+    central differences:
+        df/dx = Im(f(x + ih)) / h
+        df/dx = (f(x + h) - f(x - h)) / 2h
+    """
+    arguments = [values for values, _ in split.values()]
+    derivatives = {}
+    for index, (key, (values, uncertainties)) in enumerate(split.items()):
+        if uncertainties is None:
+            continue
+        scale = np.where(values != 0, np.abs(values), 1.0)
+        if complex_step:
+            step = COMPLEX_STEP * scale
+            derivatives[key] = np.imag(function(*_replace(arguments, index, values + step * 1j))) / step
+        else:
+            step = CENTRAL_STEP * scale
+            forward = function(*_replace(arguments, index, values + step))
+            backward = function(*_replace(arguments, index, values - step))
+            derivatives[key] = (forward - backward) / (2 * step)
+    return function(*arguments), derivatives
+
+
+def _replace(arguments: List[np.ndarray], index: int, values: np.ndarray) -> List[np.ndarray]:
+    """Private function returning a copy of a list of arguments with the argument at index replaced"""
+    return arguments[:index] + [values] + arguments[index + 1 :]
+
+
+def _propagate(
+    weighted: List[np.ndarray], uncertain: List[str], correlation: Optional[_Correlation]
+) -> Union[float, np.ndarray]:
+    """
+    Given the partial derivatives of an expression multiplied by the uncertainties of each uncertain value, returns the
+    uncertainty of the expression. If there is a correlation matrix, the product J C Jᵀ is calculated for every element
+    at once, where J are the weighted derivatives and C is the correlation matrix of all uncertain values.
+    """
+    if correlation is None:
+        return np.sqrt(sum((weight ** 2 for weight in weighted), 0.0))
+
+    if any(name not in uncertain for name in correlation.names):
+        raise ValueError("Correlated values must all have uncertainties.")
+
+    indices = np.array([uncertain.index(name) for name in correlation.names])
+    matrix = np.broadcast_to(np.eye(len(uncertain)), correlation.matrix.shape[:-2] + (len(uncertain),) * 2).copy()
+    matrix[..., indices[:, None], indices[None, :]] = correlation.matrix
+    jacobian = np.stack(np.broadcast_arrays(*weighted), axis=-1)
+    # Rounding errors can make perfectly anti-correlated variances very slightly negative
+    return np.sqrt(np.maximum(np.einsum("...i,...ij,...j->...", jacobian, matrix, jacobian), 0))
+
+
+def _from_covariance(
+    split: Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]], covariance: _Correlation
+) -> Tuple[Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]], _Correlation]:
+    """
+    Replaces the uncertainties of values with the square roots of the diagonal of a covariance matrix, and returns them
+    along with the equivalent correlation matrix.
+    """
+    uncertainties = np.sqrt(np.diagonal(covariance.matrix, axis1=-2, axis2=-1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        matrix = covariance.matrix / (uncertainties[..., :, None] * uncertainties[..., None, :])
+    split = dict(split)
+    for index, name in enumerate(covariance.names):
+        split[name] = (split[name][0], uncertainties[..., index])
+    return split, _Correlation(covariance.names, np.nan_to_num(matrix), False)
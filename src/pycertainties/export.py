@@ -0,0 +1,111 @@
+import os
+from typing import List, Optional, Union
+
+import sympy as sp
+from sympy.core.expr import Expr
+from sympy.parsing.sympy_parser import parse_expr
+from sympy.printing.numpy import NumPyPrinter
+
+from pycertainties.calculations import uncertainty
+
+MODULE_TEMPLATE = '''"""
+Generated by pycertainties.export_module(...) for the equation:
+    f = {expr}
+
+value(...) and uncertainty(...) accept int/floats or broadcastable numpy arrays.
+"""
+{imports}
+
+SYMBOLS = {symbols!r}
+VARIABLES = {variables!r}
+
+
+{value}
+
+
+{uncertainty}
+
+
+def calculate({arguments}):
+    """Returns the value and uncertainty of the equation, broadcast to the shape of the arguments"""
+    result = _numpy.broadcast_arrays(_value({value_arguments}), _uncertainty({arguments}), {arguments})
+    return result[0], result[1]
+
+
+value = _value
+uncertainty = _uncertainty
+'''
+
+
+class _NumPyPrinter(NumPyPrinter):
+    """
+    Private printer referring to modules such as numpy as _numpy, so that equation symbols named after them don't
+    shadow them. Builtins such as abs are left as they are.
+    """
+
+    def _module_format(self, fqn: str, register: bool = True) -> str:
+        name = super()._module_format(fqn, register)
+        return "_" + name if "." in fqn else name
+
+
+def export_module(expr: Union[str, Expr], *variables: str, path: Optional[Union[str, os.PathLike]] = None) -> str:
+    """
+    Given either a string representation of an equation or sympy expression, and any number of 'variables' which have
+    an associated uncertainty (as with uncertainty(...)), returns the source code of a Python module that calculates
+    the equation and its uncertainty using only numpy. If a path is given, the module is also written to it.
+
+    The uncertainty equation is derived once here, so that importing and using the module doesn't require sympy. The
+    module contains the functions:
+        1) value(...)
+            - Taking every symbol of the equation in alphabetical order
+        2) uncertainty(...)
+            - Taking every symbol, followed by f"δ{variable}" for each variable in alphabetical order
+        3) calculate(...)
+            - Taking the same arguments as uncertainty(...) and returning a tuple of the value and uncertainty
+
+    Names starting with an underscore are reserved for the module itself, so the equation may not have any symbols
+    starting with one, or a ValueError is raised.
+
+    Example)
+        export_module("x*y + z", "x", "y", path="f.py")
+
+        import f
+        f.calculate(x=3, y=3, z=4, δx=0.1, δy=1) == (13, 3.0149626863362666)
+    """
+    if isinstance(expr, str):
+        expr = parse_expr(expr)
+
+    symbols = sorted((sym.name for sym in expr.free_symbols))
+    if any(name.startswith("_") for name in symbols):
+        raise ValueError("Symbols may not start with an underscore.")
+    uncertain = ["δ" + name for name in symbols if name in variables]
+    printer = _NumPyPrinter({"fully_qualified_modules": True})
+    value = _function_source("_value", symbols, expr, printer)
+    uncertainty_source = _function_source("_uncertainty", symbols + uncertain, uncertainty(expr, *variables), printer)
+    source = MODULE_TEMPLATE.format(
+        expr=expr,
+        imports="\n".join(f"import {module} as _{module}" for module in sorted({"numpy", *printer.module_imports})),
+        symbols=tuple(symbols),
+        variables=tuple(name for name in symbols if name in variables),
+        value=value,
+        uncertainty=uncertainty_source,
+        arguments=", ".join(symbols + uncertain),
+        value_arguments=", ".join(symbols),
+    )
+
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(source)
+    return source
+
+
+def _function_source(name: str, arguments: List[str], expr: Expr, printer: NumPyPrinter) -> str:
+    """
+    Private function returning the source code of a function evaluating an expression, with common subexpressions
+    assigned to local variables.
+    """
+    replacements, (reduced,) = sp.cse([expr], symbols=sp.numbered_symbols("_cse"))
+    lines = [f"def {name}({', '.join(arguments)}):"]
+    lines += [f"    {symbol} = {printer.doprint(subexpr)}" for symbol, subexpr in replacements]
+    lines.append(f"    return {printer.doprint(reduced)}")
+    return "\n".join(lines)
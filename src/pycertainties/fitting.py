@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from typing import Iterable, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pycertainties.utilities import split_vals
+from pycertainties.val import Val
+
+
+@dataclass
+class FitResult:
+    """
+    The result of one or more weighted least-squares polynomial fits.
+
+    Attributes)
+        parameters
+            - A Val of arrays of shape (..., degree + 1) holding the fitted coefficients, highest power first
+        covariance
+            - An array of shape (..., degree + 1, degree + 1) holding the covariance matrix of each fit's coefficients
+        chi_squared
+            - An array of shape (...) holding each fit's chi-squared
+        degrees_of_freedom
+            - The number of points in each fit minus the number of coefficients
+    """
+
+    parameters: Val
+    covariance: np.ndarray
+    chi_squared: np.ndarray
+    degrees_of_freedom: int
+
+    @property
+    def reduced_chi_squared(self) -> np.ndarray:
+        return self.chi_squared / self.degrees_of_freedom
+
+    def evaluate(self, x: ArrayLike) -> Val:
+        """
+        Evaluates every fitted polynomial at x, which must be broadcastable against the shape of the fits with an extra
+        trailing axis of points. The uncertainties include the covariances between each fit's coefficients.
+
+        Example)
+            polyfit([0, 1, 2], Val(np.array([1, 3, 5]), np.ones(3)), 1).evaluate([3]) == Val([7.], [1.52752523])
+        """
+        vandermonde = np.vander(np.ravel(x), self.covariance.shape[-1]).reshape(np.shape(x) + (-1,))
+        return Val(
+            np.einsum("...nk,...k->...n", vandermonde, self.parameters.value),
+            np.sqrt(np.einsum("...nk,...kj,...nj->...n", vandermonde, self.covariance, vandermonde)),
+        )
+
+
+def polyfit(x: ArrayLike, y: Union[Val, Iterable[Val], np.ndarray], degree: int) -> FitResult:
+    """
+    Fits polynomials of the given degree to many series of points at once, weighting each point by 1/δy^2.
+
+    y may be an array of Vals or a Val of arrays, of shape (..., n), where each leading index is a separate series of n
+    points. x holds the int/float positions of the points and must be broadcastable to the shape of y, so a single
+    array of n positions may be shared by every series. All of the fits are solved together with batched numpy linear
+    algebra. As with np.polyfit, each column of the weighted Vandermonde matrix is scaled to unit length and the least
+    squares problem is solved with a QR decomposition rather than the normal equations, which would square its
+    condition number and lose most of the precision of fits far from x = 0.
+
+    The covariances of the coefficients are not scaled by the reduced chi-squared (unlike np.polyfit), so they reflect
+    the uncertainties of y as given.
+
+    Example)
+        polyfit([0, 1, 2], [Val(1, 1), Val(3, 1), Val(5, 1)], 1).parameters
+            == Val(np.array([2, 1]), np.array([0.70710678, 0.91287093]))
+    """
+    values, uncertainties = split_vals(y)
+    x, values, uncertainties = np.broadcast_arrays(np.asarray(x, dtype=np.float64), values, uncertainties)
+    if not (uncertainties > 0).all():
+        raise ValueError("All uncertainties must be positive.")
+    if values.shape[-1] <= degree:
+        raise ValueError("Each series must have more points than the degree of the polynomial.")
+
+    vandermonde = np.vander(x.ravel(), degree + 1).reshape(x.shape + (degree + 1,))
+    weighted = vandermonde / uncertainties[..., None]
+    scales = np.sqrt((weighted ** 2).sum(axis=-2))
+    q, r = np.linalg.qr(weighted / scales[..., None, :])
+
+    # A = QR, so the solution of A p = b is R^-1 Qᵀ b and the covariance (AᵀA)^-1 is R^-1 R^-ᵀ
+    r_inverse = np.linalg.inv(r)
+    parameters = np.einsum("...kj,...nj,...n->...k", r_inverse, q, values / uncertainties) / scales
+    covariance = np.einsum("...ki,...ji->...kj", r_inverse, r_inverse) / (scales[..., :, None] * scales[..., None, :])
+    residuals = (values - np.einsum("...nk,...k->...n", vandermonde, parameters)) / uncertainties
+
+    return FitResult(
+        Val(parameters, np.sqrt(np.diagonal(covariance, axis1=-2, axis2=-1))),
+        covariance,
+        (residuals ** 2).sum(axis=-1),
+        values.shape[-1] - (degree + 1),
+    )
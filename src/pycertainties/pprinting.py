@@ -1,14 +1,14 @@
-from typing import Union
+from typing import Any, Dict, Union, cast
 
 import sympy as sp
 from sympy.core.expr import Expr
 from sympy.parsing.sympy_parser import parse_expr
 
-from pycertainties.calculations import Real, calculate, uncertainty
+from pycertainties.calculations import FUNCTION, FUNCTION_UNCERTAINTY, IterableValOrReal, Real, calculate, uncertainty
 from pycertainties.val import Val
 
-f = sp.symbols("f(...)")
-df = sp.symbols("δf(...)")
+f = FUNCTION
+df = FUNCTION_UNCERTAINTY
 
 
 def pprint_uncertainty(expr: Union[str, Expr], *variables: str) -> None:
@@ -31,12 +31,13 @@ def pprint_uncertainty(expr: Union[str, Expr], *variables: str) -> None:
     sp.pprint(sp.Eq(df, uncertainty(expr, *variables)))
 
 
-def pprint_calculation(expr: Union[str, Expr], **values: Union["Val", Real]) -> None:
+def pprint_calculation(expr: Union[str, Expr], **values: Union["Val", Real, IterableValOrReal]) -> None:
     """
     Given either a string representation of an equation or sympy expression, and the values of all symbols in the
     equation, pretty-prints the equation, the result, the uncertainty equation of the equaltion, and its result.
 
-    Each value may be an int/float or a Val type.
+    Each value may be anything accepted by calculate(...). The equation is only calculated once, along with its
+    uncertainty equation, using calculate(..., report=True).
 
     Example)
         pprint_calculation("x*y + z", x=Val(3, 0.1), y=Val(3, 3), z=4) ->
@@ -47,13 +48,4 @@ def pprint_calculation(expr: Union[str, Expr], **values: Union["Val", Real]) ->
             δf(...) = ╲╱  dx ⋅y  + dy ⋅x
                 -> 9.00499861188218
     """
-    if isinstance(expr, str):
-        expr = parse_expr(expr)
-
-    result = calculate(expr, **values)
-
-    sp.pprint(sp.Eq(f, expr))
-    print("\t->", result.value)  # type: ignore
-
-    sp.pprint(sp.Eq(df, uncertainty(expr, *(key for key, value in values.items() if isinstance(value, Val)))))
-    print("\t->", result.uncertainty)  # type: ignore
+    print(calculate(expr, report=True, **cast(Dict[str, Any], values)).pretty, end="")
@@ -1,5 +1,9 @@
+import functools
 from typing import Tuple, Union
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 Real = Union[int, float]
 
 
@@ -32,13 +36,84 @@ def uncertainty_str(val: Real, dval: Real) -> str:
         return "({} \u00b1 {})e{}".format(*_uncertainty_str_decimal(val, dval), vpow)
 
 
+def uncertainty_strs(values: ArrayLike, uncertainties: ArrayLike) -> np.ndarray:
+    """
+    Vectorized version of uncertainty_str(...). Given broadcastable arrays of values and uncertainties, returns a numpy
+    array of strings of their broadcast shape, using the same representation as uncertainty_str(...).
+
+    The exponents of all values and uncertainties are found with numpy in a single pass rather than by formatting each
+    number, so this should be preferred for formatting large numbers of values.
+
+    Example)
+        uncertainty_strs([321.8, 3.21856e-10], [.0324, 3.24e-12])
+            == np.array(["321.80 ± 0.03", "(3.22 ± 0.03)e-10"], dtype=object)
+    """
+    values, uncertainties = np.broadcast_arrays(
+        np.asarray(values, dtype=np.float64), np.asarray(uncertainties, dtype=np.float64)
+    )
+    if not np.isfinite(uncertainties).all():
+        raise ValueError("Uncertainties must be finite.")
+
+    vpows = _get_pows(values, default=1)
+    exponential = (vpows < -3) | (vpows > 3)
+    # numpy's vectorized power is not always correctly rounded, so scale by the same factors as uncertainty_str(...)
+    pows, inverse = np.unique(np.where(exponential, vpows, 0), return_inverse=True)
+    scales = np.array([10 ** -pow for pow in pows.tolist()], dtype=np.float64)[inverse].reshape(values.shape)
+    scaled_values = values * scales
+    scaled_uncertainties = uncertainties * scales
+    dpows = _get_pows(scaled_uncertainties)
+
+    # Uncertainties whose leading digit rounds to a 1 are shown with an extra digit. Rows where numpy's rounding can't
+    # be trusted to match round(...) (near ties, rounding to tens or more, or near the limits of float precision) are
+    # formatted exactly as uncertainty_str(...) would.
+    mantissas = np.abs(scaled_uncertainties) * 10.0 ** -dpows.astype(np.float64)
+    shown_dpows = dpows - np.isin(np.round(mantissas), (1, 10))
+    exact = (np.abs(mantissas % 1 - 0.5) < 1e-6) | (shown_dpows > 0) | (shown_dpows < -11)
+
+    strings = np.empty(values.shape, dtype=object)
+    strings.flat[:] = [
+        (
+            ("({} \u00b1 {})e{}" if is_exponential else "{} \u00b1 {}").format(
+                *_uncertainty_str_rounded(val, dval, dpow), vpow
+            )
+            if is_exact
+            else _template(-shown_dpow, is_exponential).format(val, dval, vpow)
+        )
+        for val, dval, dpow, shown_dpow, vpow, is_exponential, is_exact in zip(
+            scaled_values.ravel().tolist(),
+            scaled_uncertainties.ravel().tolist(),
+            dpows.ravel().tolist(),
+            shown_dpows.ravel().tolist(),
+            vpows.ravel().tolist(),
+            exponential.ravel().tolist(),
+            exact.ravel().tolist(),
+        )
+    ]
+    return strings
+
+
+@functools.lru_cache(maxsize=None)
+def _template(precision: int, exponential: bool) -> str:
+    """Returns a format string for a value, uncertainty and power, showing the value and uncertainty to precision"""
+    if exponential:
+        return f"({{0:.{precision}f}} \u00b1 {{1:.{precision}f}})e{{2}}"
+    return f"{{0:.{precision}f}} \u00b1 {{1:.{precision}f}}"
+
+
 def _uncertainty_str_decimal(val: Real, dval: Real) -> Tuple[str, str]:
     """
     Private function used to calculate the non-exponential part of a string representation of a value and its
     uncertainty.
     """
-    dpow = _get_pow(dval)
-    if f"{abs(round(dval, -dpow)):e}"[0] == "1":
+    return _uncertainty_str_rounded(val, dval, _get_pow(dval))
+
+
+def _uncertainty_str_rounded(val: Real, dval: Real, dpow: int) -> Tuple[str, str]:
+    """
+    Private function performing the work of _uncertainty_str_decimal(...) given the power of the uncertainty's
+    exponential representation.
+    """
+    if round(abs(round(dval, -dpow)) * 10.0 ** -dpow) in (1, 10):
         dpow -= 1
     val = round(val, -dpow)
     dval = round(dval, -dpow)
@@ -54,6 +129,23 @@ def _get_pow(val: Real) -> int:
     return int(string[start_index:])
 
 
+def _get_pows(values: np.ndarray, default: int = 0) -> np.ndarray:
+    """
+    Vectorized version of _get_pow(...). Returns the powers of the exponential representations of an array of numbers,
+    using default for numbers that are not finite.
+    """
+    magnitudes = np.abs(values)
+    finite = np.isfinite(magnitudes)
+    nonzero = finite & (magnitudes > 0)
+    pows = np.where(finite, 0, default)
+    pows[nonzero] = np.floor(np.log10(magnitudes[nonzero]))
+
+    # Exponential representations round the mantissa to 6 decimal places, which may carry into the next power
+    mantissas = np.round(magnitudes[nonzero] / 10.0 ** pows[nonzero].astype(np.float64), 6)
+    pows[nonzero] += (mantissas >= 10).astype(int) - (mantissas < 1).astype(int)
+    return pows
+
+
 def _format(value: Real, precision: int) -> str:
     """Returns a string representation of value to the specified precision"""
     return f"{{:.{precision}f}}".format(value)
@@ -0,0 +1,145 @@
+import csv
+import itertools
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, TextIO, Tuple, Union
+
+import numpy as np
+
+from pycertainties.strings import uncertainty_strs
+from pycertainties.val import Val
+
+Column = Union[Val, Tuple[np.ndarray, np.ndarray], Iterable[Any]]
+
+LATEX_SPECIAL_CHARACTERS = str.maketrans({char: "\\" + char for char in "&%$#_{}"})
+
+
+def write_table(
+    file: TextIO, columns: Mapping[str, Column], table_format: str = "csv", batch_size: int = 10000
+) -> None:
+    """
+    Given a file object and a mapping of column headers to columns, writes a table of the columns to the file as either
+    "csv", "latex" (a tabular environment) or "markdown".
+
+    Each column may either be a:
+        1) A Val whose value and uncertainty are numpy arrays
+        2) A tuple of exactly two numpy arrays, the values and the uncertainties
+        3) An iterable (such as a list, numpy array, generator or any other tuple) of Vals or any other objects
+
+    Vals are written using the same representation as str(Val) and other objects are written using str(...). Rows are
+    formatted batch_size at a time with uncertainty_strs(...) and streamed to the file, so that only one batch is ever
+    held in memory. All columns must have the same length.
+
+    Example)
+        write_table(sys.stdout, {"x": [1, 2], "f(x)": (np.array([321.8, 3.21856e-10]), np.array([.0324, 3.24e-12]))})
+            ->
+                x,f(x)
+                1,321.80 ± 0.03
+                2,(3.22 ± 0.03)e-10
+    """
+    if table_format not in _WRITERS:
+        raise ValueError(f"Table format must be one of {', '.join(_WRITERS)}.")
+    start, write_rows, end = _WRITERS[table_format](file, len(columns))
+
+    start(list(columns))
+    batches = [_column_batches(column, batch_size) for column in columns.values()]
+    while True:
+        cells = [next(column_batches, None) for column_batches in batches]
+        if all(column_cells is None for column_cells in cells):
+            break
+        if any(column_cells is None for column_cells in cells):
+            raise ValueError("All columns must have the same length.")
+        if len({len(strings) for strings, _ in cells}) > 1:  # type: ignore
+            raise ValueError("All columns must have the same length.")
+        write_rows(cells)
+    end()
+
+
+def _column_batches(column: Column, batch_size: int) -> Iterator[Tuple[List[str], List[bool]]]:
+    """
+    Private function generating the cells of a column batch_size at a time, along with whether each cell is a Val.
+    """
+    if isinstance(column, Val) or _is_array_pair(column):
+        values, uncertainties = (column.value, column.uncertainty) if isinstance(column, Val) else column
+        values, uncertainties = np.broadcast_arrays(np.ravel(values), np.ravel(uncertainties))
+        for start in range(0, len(values), batch_size):
+            end = start + batch_size
+            strings = uncertainty_strs(values[start:end], uncertainties[start:end]).tolist()
+            yield strings, [True] * len(strings)
+        return
+
+    iterator = iter(column)
+    while items := list(itertools.islice(iterator, batch_size)):
+        are_vals = [isinstance(item, Val) for item in items]
+        strings = ["" if is_val else str(item) for item, is_val in zip(items, are_vals)]
+        indices = [index for index, is_val in enumerate(are_vals) if is_val]
+        val_strings = uncertainty_strs([items[i].value for i in indices], [items[i].uncertainty for i in indices])
+        for index, string in zip(indices, val_strings.tolist()):
+            strings[index] = string
+        yield strings, are_vals
+
+
+def _is_array_pair(column: Column) -> bool:
+    """Private function returning whether a column is a tuple of a numpy array of values and one of uncertainties"""
+    return isinstance(column, tuple) and len(column) == 2 and all(isinstance(item, np.ndarray) for item in column)
+
+
+def _csv_writer(file: TextIO, _: int) -> Tuple[Callable, Callable, Callable]:
+    """Private function returning functions writing the start, rows and end of a CSV table"""
+    writer = csv.writer(file)
+    return (
+        writer.writerow,
+        lambda cells: writer.writerows(zip(*(column_cells for column_cells, _ in cells))),
+        lambda: None,
+    )
+
+
+def _latex_writer(file: TextIO, num_columns: int) -> Tuple[Callable, Callable, Callable]:
+    """Private function returning functions writing the start, rows and end of a LaTeX tabular environment"""
+
+    def start(headers: List[str]) -> None:
+        file.write(f"\\begin{{tabular}}{{{'c' * num_columns}}}\n\\hline\n")
+        file.write(" & ".join(header.translate(LATEX_SPECIAL_CHARACTERS) for header in headers) + " \\\\\n\\hline\n")
+
+    def write_rows(cells: List[Tuple[List[str], List[bool]]]) -> None:
+        columns = [
+            [
+                _latex_val(cell) if is_val else cell.translate(LATEX_SPECIAL_CHARACTERS)
+                for cell, is_val in zip(column_cells, are_vals)
+            ]
+            for column_cells, are_vals in cells
+        ]
+        file.write("".join(" & ".join(row) + " \\\\\n" for row in zip(*columns)))
+
+    return start, write_rows, lambda: file.write("\\hline\n\\end{tabular}\n")
+
+
+def _latex_val(cell: str) -> str:
+    """Private function converting the string representation of a Val to LaTeX math"""
+    cell = cell.replace("\u00b1", "\\pm")
+    if cell.startswith("("):
+        mantissa, _, exponent = cell.rpartition("e")
+        cell = f"{mantissa} \\times 10^{{{exponent}}}"
+    return f"${cell}$"
+
+
+def _markdown_writer(file: TextIO, num_columns: int) -> Tuple[Callable, Callable, Callable]:
+    """Private function returning functions writing the start, rows and end of a Markdown table"""
+
+    def start(headers: List[str]) -> None:
+        file.write("| " + " | ".join(header.replace("|", "\\|") for header in headers) + " |\n")
+        file.write("|" + " --- |" * num_columns + "\n")
+
+    def write_rows(cells: List[Tuple[List[str], List[bool]]]) -> None:
+        columns = [
+            [cell if is_val else cell.replace("|", "\\|") for cell, is_val in zip(column_cells, are_vals)]
+            for column_cells, are_vals in cells
+        ]
+        file.write("".join("| " + " | ".join(row) + " |\n" for row in zip(*columns)))
+
+    return start, write_rows, lambda: None
+
+
+_WRITERS: Dict[str, Callable[[TextIO, int], Tuple[Callable, Callable, Callable]]] = {
+    "csv": _csv_writer,
+    "latex": _latex_writer,
+    "markdown": _markdown_writer,
+}
@@ -1,14 +1,16 @@
 import dataclasses
-from typing import Callable, Iterable, List, Tuple, TypeVar, Union
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
 
 import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
 
-from pycertainties.val import Val
+from pycertainties.val import UFUNC_DERIVATIVES, Val
 
 T = TypeVar("T")
 V = TypeVar("V")
 RecursiveIterable = Iterable[Union[T, "RecursiveIterable"]]  # type: ignore
 RecursiveList = List[Union[T, "RecursiveList"]]  # type: ignore
+Structure = Optional[Tuple["Structure", ...]]  # type: ignore
 
 
 def operate_recursive(function: Callable[..., V], *iterables: RecursiveIterable[V]) -> RecursiveList[V]:
@@ -43,11 +45,71 @@ def _operate_recursive(
     return result
 
 
-def to_val_array(values: np.ndarray, uncertainties: np.ndarray) -> np.ndarray:
+def operate_flat(function: Callable[..., Sequence[V]], *iterables: RecursiveIterable[T]) -> RecursiveList[V]:
+    """
+    Performs the same operation as operate_recursive(...); however, each iterable is flattened once into a list of its
+    scalers and "function" is invoked a single time with one such list per iterable. It must return a sequence with one
+    result per scaler, which is rebuilt into a list of the same shape as the iterables.
+
+    Unlike operate_recursive(...), iterables of different shapes raise a ValueError instead of being truncated.
+
+    Example)
+        operate_flat(
+            lambda *lists: [sum(items) for items in zip(*lists)],
+            [1, 2, [3, [4, 5]]],
+            [10, 20, [30, [40, 50]]],
+        ) == [11, 22, [33, [44, 55]]]
+    """
+    flattened = [_flatten(iterable) for iterable in iterables]
+    structure = flattened[0][1]
+    if any(other != structure for _, other in flattened[1:]):
+        raise ValueError("All iterables must have the same shape.")
+
+    results = function(*(leaves for leaves, _ in flattened))
+    if len(results) != len(flattened[0][0]):
+        raise ValueError("Function must return exactly one result per scaler.")
+    return _rebuild(iter(results), structure)  # type: ignore
+
+
+def _flatten(iterable: RecursiveIterable[T]) -> Tuple[List[T], Structure]:
+    """
+    Private function returning a list of all scalers in an iterable of more iterables or scalers, along with its
+    structure. The structure is a tuple holding None for each scaler and a nested structure for each sub-iterable.
+    """
+    leaves: List[T] = []
+    return leaves, _flatten_into(iterable, leaves)
+
+
+def _flatten_into(item: Union[T, RecursiveIterable[T]], leaves: List[T]) -> Structure:
+    """Private function performing the work of _flatten recursively"""
+    if isinstance(item, Iterable):  # pylint: disable=W1116
+        return tuple(_flatten_into(sub_item, leaves) for sub_item in item)  # type: ignore
+    leaves.append(item)  # type: ignore
+    return None
+
+
+def _rebuild(leaves: Iterator[V], structure: Structure) -> Union[V, RecursiveList[V]]:
+    """Private function rebuilding the output of _flatten(...) into nested lists"""
+    if structure is None:
+        return next(leaves)
+    return [_rebuild(leaves, sub_structure) for sub_structure in structure]
+
+
+def to_val_array(
+    values: np.ndarray,
+    uncertainties: np.ndarray,
+    dtype: Optional[DTypeLike] = None,
+    uncertainty_dtype: Optional[DTypeLike] = None,
+) -> np.ndarray:
     """
     Converts two numpy arrays of float/integer types and combines them into a single numpy array of Val types where the
     values are taken from the first array and the uncertainties are taken from the second array.
 
+    If a dtype is given, the values of each Val are converted to scalars of that type, and the uncertainties to scalars
+    of uncertainty_dtype, which defaults to dtype. This doesn't reduce memory, as each element is still a Val holding
+    numpy scalars, which are no smaller than Python floats. Use from_val_array(...) or Val.astype(...) on a Val of
+    arrays to store uncertainties compactly as np.float32.
+
     Example:
         to_val_array(np.array([10, 100, 80]), np.array([.1, .15, .35]))
             == np.array([Val(10, 0.1), Val(100, 0.15), Val(80, 0.35)])
@@ -55,6 +117,12 @@ def to_val_array(values: np.ndarray, uncertainties: np.ndarray) -> np.ndarray:
     is_array = isinstance(uncertainties, np.ndarray)
     if is_array and values.shape != uncertainties.shape:
         raise ValueError("Values and uncertainties must have the same shape.")
+    if uncertainty_dtype is None:
+        uncertainty_dtype = dtype
+    if dtype is not None:
+        values = np.asarray(values, dtype=dtype)
+    if uncertainty_dtype is not None:
+        uncertainties = np.asarray(uncertainties, dtype=uncertainty_dtype)[()]
     shape = values.shape
     val_array = np.zeros(values.shape, dtype=Val)
     for index in np.ndindex(shape):
@@ -63,22 +131,139 @@ def to_val_array(values: np.ndarray, uncertainties: np.ndarray) -> np.ndarray:
     return val_array
 
 
-def from_val_array(val_array: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+def from_val_array(
+    val_array: np.ndarray, dtype: DTypeLike = np.float64, uncertainty_dtype: Optional[DTypeLike] = None
+) -> Tuple[np.ndarray, np.ndarray]:
     """
     Converts a numpy array of Val types to a tuple where both item are numpy arrays of float/integer types where the
     first consists of the array's values where the second consists of the array's uncertainties.
 
+    The values array is created with the given dtype, and the uncertainties array with uncertainty_dtype, which
+    defaults to dtype.
+
         from_val_array(np.array([Val(10, 0.1), Val(100, 0.15), Val(80, 0.35)]))
             == (np.array([10, 100, 80]), np.array([.1, .15, .35]))
     """
-    values = np.zeros(val_array.shape)
-    uncertanties = np.zeros(val_array.shape)
+    if uncertainty_dtype is None:
+        uncertainty_dtype = dtype
+    values = np.zeros(val_array.shape, dtype=dtype)
+    uncertanties = np.zeros(val_array.shape, dtype=uncertainty_dtype)
 
     for ind in np.ndindex(val_array.shape):
         values[ind], uncertanties[ind] = dataclasses.astuple(val_array[ind])
     return values, uncertanties
 
 
+def val_sum(values: Union[Val, Iterable[Val], np.ndarray], axis: Optional[int] = None) -> Val:
+    """
+    Sums an array of Vals (or a Val of arrays) along an axis, or over every element if axis is None, in a single
+    vectorized pass. Returns a Val of arrays, or of scalers if every element was summed.
+
+    Example)
+        val_sum(np.array([Val(1, 3), Val(2, 4)])) == Val(3, 5)
+    """
+    values, uncertainties = split_vals(values)
+    return Val(values.sum(axis=axis), np.sqrt((uncertainties ** 2).sum(axis=axis)))
+
+
+def val_mean(values: Union[Val, Iterable[Val], np.ndarray], axis: Optional[int] = None) -> Val:
+    """
+    Calculates the unweighted mean of an array of Vals (or a Val of arrays) along an axis, or over every element if
+    axis is None. See weighted_average(...) for a mean weighted by uncertainties.
+
+    Example)
+        val_mean(np.array([Val(1, 3), Val(2, 4)])) == Val(1.5, 2.5)
+    """
+    values, uncertainties = split_vals(values)
+    count = values.size if axis is None else values.shape[axis]
+    return Val(values.sum(axis=axis) / count, np.sqrt((uncertainties ** 2).sum(axis=axis)) / count)
+
+
+def val_cumsum(values: Union[Val, Iterable[Val], np.ndarray], axis: Optional[int] = None) -> Val:
+    """
+    Calculates the cumulative sum of an array of Vals (or a Val of arrays) along an axis, or over the flattened array if
+    axis is None, returning a Val of arrays.
+
+    Example)
+        val_cumsum(np.array([Val(1, 3), Val(2, 4)])) == Val(np.array([1, 3]), np.array([3, 5]))
+    """
+    values, uncertainties = split_vals(values)
+    return Val(values.cumsum(axis=axis), np.sqrt((uncertainties ** 2).cumsum(axis=axis)))
+
+
+def val_dot(a: Union[Val, Iterable[Val], np.ndarray], b: Union[Val, Iterable[Val], np.ndarray]) -> Val:
+    """
+    Calculates np.dot(a, b) where either may be an array of Vals, a Val of arrays or an array of int/floats. All
+    elements are treated as independent, so that the uncertainty of each product-sum is:
+        √(Σ(b_i^2*δa_i^2 + a_i^2*δb_i^2))
+
+    Example)
+        val_dot([Val(1, 0.1), Val(2, 0.1)], [3, 4]) == Val(11, 0.5)
+    """
+    return _product(np.dot, a, b)
+
+
+def val_matmul(a: Union[Val, Iterable[Val], np.ndarray], b: Union[Val, Iterable[Val], np.ndarray]) -> Val:
+    """
+    Calculates a @ b where either may be an array of Vals, a Val of arrays or an array of int/floats, propagating
+    uncertainties in the same way as val_dot(...).
+    """
+    return _product(np.matmul, a, b)
+
+
+def _product(
+    function: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    a: Union[Val, Iterable[Val], np.ndarray],
+    b: Union[Val, Iterable[Val], np.ndarray],
+) -> Val:
+    """Private function performing the work of val_dot(...) and val_matmul(...) using the given product function"""
+    a_values, a_uncertainties = split_vals(a)
+    b_values, b_uncertainties = split_vals(b)
+    return Val(
+        function(a_values, b_values),
+        np.sqrt(function(a_uncertainties ** 2, b_values ** 2) + function(a_values ** 2, b_uncertainties ** 2)),
+    )
+
+
+def val_ufunc(ufunc: np.ufunc, *arrays: Union[Val, Iterable[Union[Val, T]], np.ndarray]) -> Val:
+    """
+    Applies a numpy ufunc supported by Vals (see val.UFUNC_DERIVATIVES) to arrays of Vals and int/floats, or Vals of
+    arrays, in a single vectorized pass rather than calling the ufunc's method on each Val as numpy does for arrays of
+    Vals. Returns a Val of arrays, which to_val_array(...) converts back into an array of Vals.
+
+    Example)
+        val_ufunc(np.hypot, [Val(3, 0.3), Val(6, 0.8)], [4, 8]) == Val(np.array([5., 10.]), np.array([0.18, 0.48]))
+    """
+    if ufunc not in UFUNC_DERIVATIVES:
+        raise ValueError(f"Vals do not support the ufunc {ufunc.__name__}.")
+    return ufunc(*(Val(*split_vals(array)) for array in arrays))
+
+
+def split_vals(values: Union[Val, Iterable[Union[Val, T]], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Splits a Val of arrays, or an array of Vals and int/floats, into np.float64 arrays of values and uncertainties of
+    the same shape. int/floats have no uncertainty.
+
+    Example)
+        split_vals([Val(10, 0.1), 100]) == (np.array([10., 100.]), np.array([0.1, 0.]))
+    """
+    if isinstance(values, Val):
+        return tuple(  # type: ignore
+            np.broadcast_arrays(
+                np.asarray(values.value, dtype=np.float64), np.asarray(values.uncertainty, dtype=np.float64)
+            )
+        )
+    array = np.asarray(values)
+    if array.dtype != object:
+        return array.astype(np.float64, copy=False), np.zeros(array.shape)
+
+    split = np.empty(array.shape + (2,))
+    for ind in np.ndindex(array.shape):
+        item = array[ind]
+        split[ind] = (item.value, item.uncertainty) if isinstance(item, Val) else (item, 0)
+    return split[..., 0], split[..., 1]
+
+
 def weighted_average(values: Iterable[Val]) -> Val:
     """
     Calculates a weighted average of a group of values with uncertainties.
@@ -86,6 +271,33 @@ def weighted_average(values: Iterable[Val]) -> Val:
     The weights of avg(x ± y) are equal to 1/y^2.
     """
     return Val(
-        np.average([x.value for x in values], weights=[x.uncertainty ** -2 for x in values]),
-        np.average([x.uncertainty for x in values], weights=[x.uncertainty ** -2 for x in values]),
+        np.average([x.value for x in values], weights=[x.uncertainty ** -2 for x in values]),  # type: ignore
+        np.average([x.uncertainty for x in values], weights=[x.uncertainty ** -2 for x in values]),  # type: ignore
+    )
+
+
+def grouped_weighted_average(values: Union[Val, Iterable[Val], np.ndarray], keys: ArrayLike) -> Tuple[np.ndarray, Val]:
+    """
+    Calculates the weighted_average(...) of each group of values sharing the same key in a single vectorized pass.
+
+    values may be an array of Vals or a Val of arrays, and keys is an array of the same shape holding the integer or
+    label of each value's group. Returns a sorted array of the unique keys and a Val of arrays holding
+    the weighted average of each key's group, in the same order.
+
+    Example)
+        grouped_weighted_average([Val(1, 1), Val(5, 2), Val(3, 1), Val(7, 1)], ["a", "b", "a", "b"])
+            == (np.array(["a", "b"]), Val(np.array([2.0, 6.6]), np.array([1.0, 1.2])))
+    """
+    values, uncertainties = split_vals(values)
+    keys = np.asarray(keys)
+    if keys.shape != values.shape:
+        raise ValueError("There must be exactly one key for each value.")
+    unique_keys, groups = np.unique(keys.ravel(), return_inverse=True)
+    values, uncertainties = values.ravel(), uncertainties.ravel()
+
+    weights = uncertainties ** -2.0
+    weight_sums = np.bincount(groups, weights=weights)
+    return unique_keys, Val(
+        np.bincount(groups, weights=weights * values) / weight_sums,
+        np.bincount(groups, weights=weights * uncertainties) / weight_sums,
     )
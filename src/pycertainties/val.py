@@ -1,16 +1,17 @@
 from dataclasses import dataclass
-from typing import Iterable, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
 import numpy as np
+from numpy.typing import DTypeLike
 
-from pycertainties.strings import Real, uncertainty_str
+from pycertainties.strings import Real, uncertainty_str, uncertainty_strs
 
 IterableReal = Iterable[Union[Real, "IterableReal"]]  # type: ignore
 RecursiveReal = Union[Real, IterableReal]  # type: ignore
 
 
 @dataclass
-class Val:
+class Val:  # pylint: disable=R0904
     """
     This class is number-like type that represents a value and associated uncertainty.
 
@@ -18,6 +19,13 @@ class Val:
     uncertainties:
         δf(r_i) = √(Σ(df/dr_i^2*δr_i^2))
 
+    Also implements numpy's ufunc protocol for the ufuncs in UFUNC_DERIVATIVES, such as np.exp(...), np.arcsin(...)
+    and np.hypot(...), using their analytic derivatives. For a Val of numpy arrays the value and uncertainty are each
+    calculated with a single vectorized call, broadcasting against any numpy arrays of int/floats. Numpy arrays of Vals,
+    or of int/floats combined with Vals of scalers, are calculated element-wise: numpy calls the method of the same
+    name on each Val and returns a numpy array of Vals. utilities.val_ufunc(...) applies a ufunc to arrays of Vals in a
+    single vectorized call instead.
+
     Additionally, Val(a, b) comes with appropriate string conversions based on the relative and absolute values of
     a and b.
 
@@ -27,6 +35,7 @@ class Val:
                             Val(100, 2) + Val(50.5, 0.2) == Val(150.5, 2.009975124224178)
                                       Val(100, .1).sin() == Val(-0.5063656411097588, 0.08623188722876839)
                      Val(4.605170185988092, 0.001).log() == Val(4.605170185988092, 0.001)
+                                    np.exp(Val(1, 0.1)) == Val(2.718281828459045, 0.2718281828459045)
 
                                   str(Val(321.8, .0324)) == "321.80 ± 0.03"
                                 str(Val(321.856, .0324)) == "321.86 ± 0.03"
@@ -41,11 +50,13 @@ class Val:
 
     """
 
-    value: Real
-    uncertainty: Real
+    value: Union[Real, np.ndarray]
+    uncertainty: Union[Real, np.ndarray]
 
     def __str__(self) -> str:
-        return uncertainty_str(self.value, self.uncertainty)
+        if np.ndim(self.value) or np.ndim(self.uncertainty):
+            return np.array2string(uncertainty_strs(self.value, self.uncertainty), formatter={"all": str})
+        return uncertainty_str(self.value, self.uncertainty)  # type: ignore
 
     def __repr__(self) -> str:
         return f"Val({self.value}, {self.uncertainty})"
@@ -53,11 +64,30 @@ class Val:
     def __format__(self, format_spec: str) -> str:
         return str(self)
 
+    def astype(self, dtype: DTypeLike, uncertainty_dtype: Optional[DTypeLike] = None) -> "Val":
+        """
+        Returns a copy of the Val with its value stored as dtype and its uncertainty stored as uncertainty_dtype, which
+        defaults to dtype. Works for Vals storing either scalars or numpy arrays.
+
+        Only the storage changes. Values and uncertainties are upcast to np.float64 before being squared to propagate
+        uncertainties, so small np.float32 uncertainties don't underflow to 0.
+
+        Example)
+            Val(np.arange(3.0), np.full(3, 0.1)).astype(np.float64, np.float32)
+                == Val(np.array([0., 1., 2.]), np.array([0.1, 0.1, 0.1], dtype=np.float32))
+        """
+        if uncertainty_dtype is None:
+            uncertainty_dtype = dtype
+        return Val(np.asarray(self.value, dtype=dtype)[()], np.asarray(self.uncertainty, dtype=uncertainty_dtype)[()])
+
     def __mul__(self, other: Union["Val", Real]) -> "Val":
         if isinstance(other, Val):
             return Val(
                 self.value * other.value,
-                np.sqrt((self.value ** 2) * (other.uncertainty ** 2) + (other.value ** 2) * (self.uncertainty ** 2)),
+                np.sqrt(
+                    (_upcast(self.value) ** 2) * (_upcast(other.uncertainty) ** 2)
+                    + (_upcast(other.value) ** 2) * (_upcast(self.uncertainty) ** 2)
+                ),
             )
         else:
             return Val(self.value * other, self.uncertainty * abs(other))
@@ -70,8 +100,8 @@ class Val:
             return Val(
                 self.value / other.value,
                 np.sqrt(
-                    (other.uncertainty ** 2) * (self.value ** 2 / other.value ** 4)
-                    + (self.uncertainty ** 2 / other.value ** 2)
+                    (_upcast(other.uncertainty) ** 2) * (_upcast(self.value) ** 2 / _upcast(other.value) ** 4)
+                    + (_upcast(self.uncertainty) ** 2 / _upcast(other.value) ** 2)
                 ),
             )
         else:
@@ -82,7 +112,9 @@ class Val:
 
     def __sub__(self, other: Union["Val", Real]) -> "Val":
         if isinstance(other, Val):
-            return Val(self.value - other.value, np.sqrt(self.uncertainty ** 2 + other.uncertainty ** 2))
+            return Val(
+                self.value - other.value, np.sqrt(_upcast(self.uncertainty) ** 2 + _upcast(other.uncertainty) ** 2)
+            )
         else:
             return Val(self.value - other, self.uncertainty)
 
@@ -91,7 +123,9 @@ class Val:
 
     def __add__(self, other: Union["Val", Real]) -> "Val":
         if isinstance(other, Val):
-            return Val(self.value + other.value, np.sqrt(self.uncertainty ** 2 + other.uncertainty ** 2))
+            return Val(
+                self.value + other.value, np.sqrt(_upcast(self.uncertainty) ** 2 + _upcast(other.uncertainty) ** 2)
+            )
         else:
             return Val(self.value + other, self.uncertainty)
 
@@ -102,25 +136,184 @@ class Val:
         return Val(-self.value, self.uncertainty)
 
     def __pow__(self, power: Union["Val", Real]) -> "Val":
+        value, dvalue = _upcast(self.value), _upcast(self.uncertainty)
         if isinstance(power, Val):
-            square = self.value ** (2 * power.value)
-            first = (self.uncertainty ** 2) * ((square * power.value ** 2) / (self.value ** 2))
-            second = (power.uncertainty ** 2) * (square * np.log(self.value) ** 2)
+            square = value ** (2 * power.value)
+            first = (dvalue ** 2) * ((square * power.value ** 2) / (value ** 2))
+            second = (_upcast(power.uncertainty) ** 2) * (square * np.log(value) ** 2)
             return Val(self.value ** power.value, np.sqrt(first + second))
         else:
-            square = self.value ** (2 * power)
-            return Val(
-                self.value ** power, np.sqrt((self.uncertainty ** 2) * ((square * power ** 2) / (self.value ** 2)))
-            )
+            square = value ** (2 * power)
+            return Val(self.value ** power, np.sqrt((dvalue ** 2) * ((square * power ** 2) / (value ** 2))))
 
     def __rpow__(self, other: Real) -> "Val":
         return Val(other, 0) ** self
 
+    def __abs__(self) -> "Val":
+        return np.absolute(self)
+
+    def __pos__(self) -> "Val":
+        return np.positive(self)
+
+    def __array_ufunc__(self, ufunc: np.ufunc, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        derivatives = UFUNC_DERIVATIVES.get(ufunc)
+        if derivatives is None or method != "__call__" or kwargs or _element_wise(inputs):
+            # Calculated element-wise by numpy, with each Val as an object
+            return getattr(ufunc, method)(*(_object_scalar(item) for item in inputs), **kwargs)
+
+        values = [item.value if isinstance(item, Val) else item for item in inputs]
+        value = ufunc(*values)
+        floats = [_upcast(item) for item in values]
+        # Values without an uncertainty contribute nothing, rather than 0*inf where the derivative is infinite
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = [
+                np.where(item.uncertainty == 0, 0.0, derivative(*floats) * _upcast(item.uncertainty))
+                for derivative, item in zip(derivatives, inputs)
+                if isinstance(item, Val)
+            ]
+        uncertainty = np.abs(terms[0]) if len(terms) == 1 else np.sqrt(sum(term ** 2 for term in terms))
+        if np.shape(uncertainty) != np.shape(value):
+            uncertainty = np.broadcast_to(uncertainty, np.shape(value)).copy()
+        return Val(value, uncertainty[()])
+
     def log(self) -> "Val":
-        return Val(np.log(self.value), np.sqrt((self.uncertainty ** 2) / (self.value ** 2)))
+        return Val(np.log(self.value), np.sqrt((_upcast(self.uncertainty) ** 2) / (_upcast(self.value) ** 2)))
 
     def sin(self) -> "Val":
-        return Val(np.sin(self.value), np.sqrt((self.uncertainty ** 2) * (np.cos(self.value) ** 2)))
+        return Val(np.sin(self.value), np.sqrt((_upcast(self.uncertainty) ** 2) * (np.cos(_upcast(self.value)) ** 2)))
 
     def sqrt(self) -> "Val":
         return self ** (1 / 2)
+
+    def cbrt(self) -> "Val":
+        return np.cbrt(self)
+
+    def exp(self) -> "Val":
+        return np.exp(self)
+
+    def exp2(self) -> "Val":
+        return np.exp2(self)
+
+    def expm1(self) -> "Val":
+        return np.expm1(self)
+
+    def log2(self) -> "Val":
+        return np.log2(self)
+
+    def log10(self) -> "Val":
+        return np.log10(self)
+
+    def log1p(self) -> "Val":
+        return np.log1p(self)
+
+    def cos(self) -> "Val":
+        return np.cos(self)
+
+    def tan(self) -> "Val":
+        return np.tan(self)
+
+    def arcsin(self) -> "Val":
+        return np.arcsin(self)
+
+    def arccos(self) -> "Val":
+        return np.arccos(self)
+
+    def arctan(self) -> "Val":
+        return np.arctan(self)
+
+    def sinh(self) -> "Val":
+        return np.sinh(self)
+
+    def cosh(self) -> "Val":
+        return np.cosh(self)
+
+    def tanh(self) -> "Val":
+        return np.tanh(self)
+
+    def arcsinh(self) -> "Val":
+        return np.arcsinh(self)
+
+    def arccosh(self) -> "Val":
+        return np.arccosh(self)
+
+    def arctanh(self) -> "Val":
+        return np.arctanh(self)
+
+    def deg2rad(self) -> "Val":
+        return np.deg2rad(self)
+
+    def rad2deg(self) -> "Val":
+        return np.rad2deg(self)
+
+    def hypot(self, other: Union["Val", Real]) -> "Val":
+        return np.hypot(self, other)  # type: ignore
+
+    def arctan2(self, other: Union["Val", Real]) -> "Val":
+        return np.arctan2(self, other)  # type: ignore
+
+
+# The partial derivatives of each supported ufunc with respect to each of its arguments
+UFUNC_DERIVATIVES: Dict[np.ufunc, Tuple[Callable[..., Any], ...]] = {
+    np.negative: (lambda x: -1,),
+    np.positive: (lambda x: 1,),
+    np.absolute: (lambda x: 1,),
+    np.square: (lambda x: 2 * x,),
+    np.sqrt: (lambda x: 1 / (2 * np.sqrt(x)),),
+    np.cbrt: (lambda x: 1 / (3 * np.cbrt(x) ** 2),),
+    np.exp: (np.exp,),
+    np.exp2: (lambda x: np.exp2(x) * np.log(2),),
+    np.expm1: (np.exp,),
+    np.log: (lambda x: 1 / x,),
+    np.log2: (lambda x: 1 / (x * np.log(2)),),
+    np.log10: (lambda x: 1 / (x * np.log(10)),),
+    np.log1p: (lambda x: 1 / (1 + x),),
+    np.sin: (np.cos,),
+    np.cos: (lambda x: -np.sin(x),),
+    np.tan: (lambda x: 1 / np.cos(x) ** 2,),
+    np.arcsin: (lambda x: 1 / np.sqrt(1 - x ** 2),),
+    np.arccos: (lambda x: -1 / np.sqrt(1 - x ** 2),),
+    np.arctan: (lambda x: 1 / (1 + x ** 2),),
+    np.sinh: (np.cosh,),
+    np.cosh: (np.sinh,),
+    np.tanh: (lambda x: 1 / np.cosh(x) ** 2,),
+    np.arcsinh: (lambda x: 1 / np.sqrt(x ** 2 + 1),),
+    np.arccosh: (lambda x: 1 / np.sqrt(x ** 2 - 1),),
+    np.arctanh: (lambda x: 1 / (1 - x ** 2),),
+    np.deg2rad: (lambda x: np.pi / 180,),
+    np.rad2deg: (lambda x: 180 / np.pi,),
+    np.add: (lambda x, y: 1, lambda x, y: 1),
+    np.subtract: (lambda x, y: 1, lambda x, y: -1),
+    np.multiply: (lambda x, y: y, lambda x, y: x),
+    np.divide: (lambda x, y: 1 / y, lambda x, y: -x / y ** 2),
+    np.power: (lambda x, y: y * x ** (y - 1), lambda x, y: x ** y * np.log(x)),
+    np.hypot: (lambda x, y: x / np.hypot(x, y), lambda x, y: y / np.hypot(x, y)),
+    np.arctan2: (lambda y, x: x / (x ** 2 + y ** 2), lambda y, x: -y / (x ** 2 + y ** 2)),
+}
+
+
+def _upcast(value: Any) -> Any:
+    """
+    Private function converting ints and floats of lower precision than np.float64 to np.float64, so that squaring a
+    small uncertainty stored as np.float32 doesn't underflow to 0
+    """
+    return np.asarray(value, dtype=np.result_type(value, np.float64))[()]
+
+
+def _element_wise(inputs: Tuple[Any, ...]) -> bool:
+    """
+    Private function returning whether the inputs of a ufunc are calculated element-wise rather than vectorized, which
+    is the case for numpy arrays of Vals, and for numpy arrays of int/floats unless any Val holds numpy arrays
+    """
+    if any(isinstance(item, np.ndarray) and item.dtype == object for item in inputs):
+        return True
+    any_arrays = any(not isinstance(item, Val) and np.ndim(item) for item in inputs)
+    return any_arrays and not any(isinstance(item, Val) and np.ndim(item.value) for item in inputs)
+
+
+def _object_scalar(item: Any) -> Any:
+    """Private function wrapping a Val in a 0-d object array, so numpy treats it as a single object"""
+    if not isinstance(item, Val):
+        return item
+    array = np.empty((), dtype=object)
+    array[()] = item
+    return array
@@ -0,0 +1,122 @@
+import asyncio
+import concurrent.futures
+import threading
+
+import numpy as np
+import pytest
+
+from pycertainties import asynchronous, calculations
+from pycertainties.val import Val
+from tests import utilities
+
+REQUESTS = (
+    {"x": Val(3, 0.1), "y": Val(3, 1), "z": 4},
+    {"x": Val(3, 0.1), "y": [Val(3, 1), [Val(5, 1)]], "z": 4},
+    {"x": [[Val(1, 0.1)], [Val(2, 0.1)]], "y": [[3, 4]], "z": Val(1, 0.5)},
+    {"x": Val(np.arange(3.0), np.full(3, 0.1)), "y": 2, "z": 1},
+)
+
+
+class CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+    """Thread pool counting the number of functions submitted to it"""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):  # pylint: disable=W0221
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def _assert_same(got, expected):
+    """Asserts that two results of calculate are approximately equal"""
+    assert type(got) is type(expected)
+    if isinstance(expected, Val):
+        np.testing.assert_allclose(got.value, expected.value)
+        np.testing.assert_allclose(got.uncertainty, expected.uncertainty)
+    else:
+        assert len(list(utilities.traverse(got))) == len(list(utilities.traverse(expected)))
+        for got_val, expected_val in zip(utilities.traverse(got), utilities.traverse(expected)):
+            utilities.assert_approx(got_val, expected_val)
+
+
+@pytest.mark.parametrize("backend", ("symbolic", "numeric"))
+def test_calculation_batcher(backend: str):
+    """Tests that concurrent calculations of the same equation are evaluated together with the correct results"""
+
+    async def calculate_all():
+        with CountingExecutor() as executor:
+            batcher = asynchronous.CalculationBatcher(executor=executor)
+            results = await asyncio.gather(
+                *(batcher.calculate("x*y + z", backend=backend, **values) for values in REQUESTS),
+                batcher.calculate("x/y", backend=backend, x=Val(1, 0.1), y=2),
+            )
+            return results, executor.submitted
+
+    results, submitted = asyncio.run(calculate_all())
+    assert submitted == 2
+    for values, result in zip(REQUESTS, results):
+        _assert_same(result, calculations.calculate("x*y + z", backend=backend, **values))
+    _assert_same(results[-1], calculations.calculate("x/y", x=Val(1, 0.1), y=2))
+
+
+def test_calculation_batcher_errors():
+    """Tests that invalid calculations raise errors without affecting others in the same batch"""
+
+    async def calculate_all():
+        batcher = asynchronous.CalculationBatcher()
+        return await asyncio.gather(
+            batcher.calculate("x + y", x=[Val(1, 0.1), [Val(2, 0.1)]], y=[1, 2]),
+            batcher.calculate("x + y", x=Val(1, 0.1), y=object()),
+            batcher.calculate("x + y", x=Val(1, 0.1), y=2),
+            return_exceptions=True,
+        )
+
+    mismatched, invalid, result = asyncio.run(calculate_all())
+    assert isinstance(mismatched, ValueError)
+    assert isinstance(invalid, TypeError)
+    utilities.assert_approx(result, Val(3, 0.1))
+
+
+def test_calculation_batcher_option_symbol():
+    """Tests that symbols with the same name as the backend option raise an error"""
+    with pytest.raises(ValueError, match="backend"):
+        asyncio.run(asynchronous.CalculationBatcher().calculate("backend*2", backend=Val(1, 0.1)))  # type: ignore
+
+
+def test_calculation_batcher_max_batch_size():
+    """Tests that filling a batch evaluates it immediately and cancels its pending flush"""
+
+    async def calculate_all():
+        batcher = asynchronous.CalculationBatcher(window=60, max_batch_size=2)
+        results = await asyncio.gather(*(batcher.calculate("x + y", x=Val(1, 0.1), y=y) for y in (1, 2)))
+        return results, batcher._timers  # pylint: disable=W0212
+
+    results, timers = asyncio.run(calculate_all())
+    utilities.assert_approx(results[1], Val(3, 0.1))
+    assert not timers
+
+
+def test_calculation_batcher_threads():
+    """Tests that a batcher can be shared by event loops running in several threads at once"""
+    batcher = asynchronous.CalculationBatcher(window=0.05)
+    results = {}
+
+    def calculate(y: int):
+        results[y] = asyncio.run(batcher.calculate("x + y", x=Val(1, 0.1), y=y))
+
+    threads = [threading.Thread(target=calculate, args=(y,), daemon=True) for y in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    assert sorted(results) == list(range(4))
+    for y, result in results.items():
+        utilities.assert_approx(result, Val(1 + y, 0.1))
+
+
+def test_calculate_async():
+    """Tests that calculations can be performed with the default batcher"""
+    result = asyncio.run(asynchronous.calculate_async("x*y + z", x=Val(3, 0.1), y=Val(3, 1), z=4))
+    utilities.assert_approx(result, calculations.calculate("x*y + z", x=Val(3, 0.1), y=Val(3, 1), z=4))
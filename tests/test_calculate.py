@@ -1,7 +1,9 @@
 import math
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pytest
+from sympy.parsing.sympy_parser import parse_expr
 
 from pycertainties import calculations
 from pycertainties.calculations import IterableValOrReal
@@ -76,3 +78,244 @@ def test_calculate_list(expr: str, values: Dict[str, IterableValOrReal], expecte
 
     for got, ex in zip(utilities.traverse(result), utilities.traverse(expected)):  # type: ignore
         utilities.assert_approx(got, ex)
+
+
+def test_calculate_list_mismatch():
+    """Tests that ragged iterable values of different shapes raise an error"""
+    with pytest.raises(ValueError):
+        calculations.calculate("x+y", x=[Val(1, 0.1), [Val(2, 0.1), 3]], y=[1, [2]])
+
+
+def test_calculate_broadcast():
+    """Tests that regularly shaped iterable values are broadcast against each other like numpy arrays"""
+    x = np.array([[Val(1, 0.1)], [Val(2, 0.2)], [Val(3, 0.3)]])
+    y = [[Val(4, 0.4), 5]]
+    result = calculations.calculate("x*y + z", x=x, y=y, z=Val(1, 1))
+
+    assert np.shape(result) == (3, 2)
+    for i, j in np.ndindex(3, 2):
+        expected = calculations.calculate("x*y + z", x=x[i, 0], y=y[0][j], z=Val(1, 1))
+        utilities.assert_approx(result[i][j], expected)  # type: ignore
+
+
+def test_calculate_broadcast_mismatch():
+    """Tests that iterable values which cannot be broadcast against each other raise an error"""
+    with pytest.raises(ValueError):
+        calculations.calculate("x+y", x=[Val(1, 0.1), Val(2, 0.1)], y=[1, 2, 3])
+
+
+@pytest.mark.parametrize("backend", ("symbolic", "numeric"))
+def test_calculate_list_constant_infinite_derivative(backend: str):
+    """
+    Tests that constants in iterables that also hold Vals have no uncertainty, even where the partial derivative with
+    respect to them is infinite
+    """
+    result = calculations.calculate("sqrt(x)*y", backend=backend, x=[Val(4, 0.1), 0], y=Val(2, 0.1))
+    expected = calculations.calculate("sqrt(x)*y", x=Val(4, 0.1), y=Val(2, 0.1))
+    utilities.assert_approx(result[0], expected)  # type: ignore
+    utilities.assert_approx(result[1], Val(0, 0))  # type: ignore
+
+
+def test_calculate_array_val():
+    """Tests that Vals storing numpy arrays are calculated element-wise and returned as a single Val"""
+    x = Val(np.array([1.0, 2.0, 3.0]), np.array([0.1, 0.2, 0.3]))
+    result = calculations.calculate("x**2 + y", x=x, y=Val(2, 0.5))
+
+    assert isinstance(result, Val)
+    for ind in range(3):
+        expected = calculations.calculate("x**2 + y", x=Val(x.value[ind], x.uncertainty[ind]), y=Val(2, 0.5))
+        utilities.assert_approx(Val(result.value[ind], result.uncertainty[ind]), expected)  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "expr, values",
+    (
+        ("x*y+z", {"x": Val(3, 0.1), "y": Val(3, 3), "z": 4}),
+        ("log(x)*sin(y)/z", {"x": Val(1605, 53), "y": Val(0.5, 0.01), "z": Val(2, 0.1)}),
+        ("x**y", {"x": Val(10, 3), "y": Val(2, 1)}),
+        ("sqrt(x)*exp(-y)", {"x": Val(np.array([1.0, 4.0, 9.0]), np.array([0.1, 0.2, 0.3])), "y": 0.5}),
+        ("atan(x/y)", {"x": [[Val(1, 0.1)], [Val(2, 0.2)]], "y": [[Val(3, 0.3), 4]]}),
+        ("x-y", {"x": [Val(1, 0.1), [Val(2, 0.2), 3]], "y": [4, [Val(5, 0.5), Val(6, 0.6)]]}),
+    ),
+)
+def test_calculate_numeric(expr: str, values: Dict[str, IterableValOrReal]):
+    """Tests that the numeric backend agrees with the symbolic backend"""
+    symbolic = calculations.calculate(expr, **values)
+    numeric = calculations.calculate(expr, backend="numeric", **values)
+
+    if isinstance(symbolic, Val):
+        np.testing.assert_allclose(numeric.value, symbolic.value, rtol=1e-12)  # type: ignore
+        np.testing.assert_allclose(numeric.uncertainty, symbolic.uncertainty, rtol=1e-12)  # type: ignore
+    else:
+        for got, ex in zip(utilities.traverse(numeric), utilities.traverse(symbolic)):  # type: ignore
+            utilities.assert_approx(got, ex)
+
+
+@pytest.mark.parametrize(
+    "expr, values, expected",
+    (
+        ("Abs(x)*y", {"x": Val(-2, 0.1), "y": Val(3, 0.1)}, Val(6, np.sqrt(0.3 ** 2 + 0.2 ** 2))),
+        ("Min(x, 3)*y", {"x": Val(np.array([2.0, 4.0]), np.array([0.1, 0.1])), "y": Val(3, 0.1)}, None),
+        ("sqrt(x**2 + y**2)*atan2(y, x)", {"x": Val(1, 0.1), "y": Val(2, 0.1)}, None),
+        ("floor(z) + x*y", {"x": Val(1, 0.1), "y": Val(2, 0.1), "z": Val(2.5, 0.1)}, Val(4, np.sqrt(0.05))),
+    ),
+)
+def test_calculate_numeric_non_analytic(expr: str, values: Dict[str, Val], expected: Optional[Val]):
+    """Tests that the numeric backend falls back to central differences for functions that aren't complex-analytic"""
+    numeric = calculations.calculate(expr, backend="numeric", **values)
+    if expected is None:
+        expected = calculations.calculate(expr, **values)  # type: ignore
+    np.testing.assert_allclose(numeric.value, expected.value, rtol=1e-12)  # type: ignore
+    np.testing.assert_allclose(numeric.uncertainty, expected.uncertainty, rtol=1e-8)  # type: ignore
+
+
+def test_calculate_invalid_backend():
+    """Tests that an unknown backend raises an error"""
+    with pytest.raises(ValueError):
+        calculations.calculate("x", backend="finite", x=Val(1, 0.1))
+
+
+@pytest.mark.parametrize("option", calculations.OPTIONS)
+def test_calculate_option_symbol(option: str):
+    """Tests that symbols with the same name as an option of calculate(...) raise an error"""
+    with pytest.raises(ValueError, match=option):
+        calculations.calculate(f"{option}*2", **{option: Val(1, 0.1)})
+
+
+def test_calculate_invalid_report():
+    """Tests that report must be a bool"""
+    with pytest.raises(ValueError):
+        calculations.calculate("x*2", x=Val(1, 0.1), report=Val(1, 0.1))  # type: ignore
+
+
+@pytest.mark.parametrize("backend", ("symbolic", "numeric"))
+@pytest.mark.parametrize(
+    "expr, values, correlation, expected",
+    (
+        ("x-y", {"x": Val(3, 0.1), "y": Val(1, 0.1)}, (("x", "y"), [[1, 0.5], [0.5, 1]]), Val(2, 0.1)),
+        ("x+y", {"x": Val(3, 0.1), "y": Val(1, 0.1)}, (("y", "x"), [[1, 1], [1, 1]]), Val(4, 0.2)),
+        (
+            "x*y+z",
+            {"x": Val(3, 0.1), "y": Val(1, 0.2), "z": Val(1, 0.1)},
+            (("x", "y"), [[1, 0.25], [0.25, 1]]),
+            Val(4, math.sqrt(0.1 ** 2 + 2 * 0.25 * 3 * 0.1 * 0.2 + 9 * 0.2 ** 2 + 0.1 ** 2)),
+        ),
+    ),
+)
+def test_calculate_correlation(expr: str, values: Dict[str, Val], correlation, expected: Val, backend: str):
+    """Tests that correlations between values are included in calculated uncertainties"""
+    utilities.assert_approx(
+        calculations.calculate(expr, backend=backend, correlation=correlation, **values), expected  # type: ignore
+    )
+
+
+def test_calculate_covariance():
+    """Tests that a covariance matrix replaces the uncertainties of its values"""
+    covariance = (("x", "y"), [[0.01, 0.005], [0.005, 0.04]])
+    result = calculations.calculate("x*y+z", x=3, y=1, z=Val(1, 0.1), covariance=covariance)
+    utilities.assert_approx(result, Val(4, math.sqrt(0.01 + 2 * 0.005 * 3 + 0.04 * 9 + 0.1 ** 2)))  # type: ignore
+
+
+def test_calculate_correlation_per_element():
+    """Tests that a separate correlation matrix can be given for each element of array values"""
+    correlations = np.array([[[1, rho], [rho, 1]] for rho in (-1, 0, 1)])
+    x = Val(np.array([1.0, 2.0, 3.0]), np.full(3, 0.1))
+    result = calculations.calculate("x+y", x=x, y=Val(1, 0.1), correlation=(("x", "y"), correlations))
+
+    np.testing.assert_allclose(result.value, [2, 3, 4])  # type: ignore
+    np.testing.assert_allclose(result.uncertainty, [0, math.sqrt(0.02), 0.2], atol=1e-12)  # type: ignore
+
+
+def test_calculate_correlation_constant():
+    """Tests that correlating a value without an uncertainty raises an error"""
+    with pytest.raises(ValueError):
+        calculations.calculate("x+y", x=Val(1, 0.1), y=1, correlation=(("x", "y"), [[1, 0.5], [0.5, 1]]))
+
+
+@pytest.mark.parametrize(
+    "option, names, matrix",
+    (
+        ("correlation", ("x", "q"), [[1, 0.5], [0.5, 1]]),
+        ("covariance", ("x", "q"), [[0.01, 0], [0, 0.01]]),
+        ("correlation", ("x", "y"), [[1, 0.5, 0], [0.5, 1, 0]]),
+        ("correlation", ("x", "y"), [[1, 0.5], [0.25, 1]]),
+        ("covariance", ("x", "y"), [[0.01, 0.005], [0, 0.01]]),
+    ),
+)
+def test_calculate_correlation_invalid(option: str, names: Tuple[str, ...], matrix):
+    """Tests that matrices of unknown values, of the wrong shape or that aren't symmetric raise an error"""
+    with pytest.raises(ValueError, match=option.capitalize()):
+        calculations.calculate("x+y", x=Val(1, 0.1), y=Val(2, 0.1), **{option: (names, matrix)})
+
+
+def test_calculate_correlation_names():
+    """Tests that the correlation symbols of different pairs of values are never the same"""
+    names = ("ab", "c", "a", "bc")
+    expr = calculations._uncertainty_expr(parse_expr("ab*c + a*bc"), names, names)  # pylint: disable=W0212
+    assert len({sym.name for sym in expr.free_symbols if sym.name.startswith("ρ")}) == 6
+
+
+@pytest.mark.parametrize(
+    "expr, values, expected_value, expected_uncertainty",
+    (
+        ("x*y+z", {"x": Val(3, 0.1), "y": Val(3, 3), "z": 4}, 13.0, "sqrt(x**2*δy**2 + y**2*δx**2)"),
+        ("x*y", {"x": [Val(1, 0.1), [Val(2, 0.1)]], "y": 3}, [3.0, [6.0]], "sqrt(y**2*δx**2)"),
+        ("x*y", {"x": np.array([1, 2]), "y": Val(3, 0.1)}, [3.0, 6.0], "sqrt(x**2*δy**2)"),
+    ),
+)
+def test_calculate_report(
+    expr: str, values: Dict[str, IterableValOrReal], expected_value: IterableValOrReal, expected_uncertainty: str
+):
+    """Tests that a report holds the result of a calculation along with its equation and uncertainty equation"""
+    report = calculations.calculate(expr, report=True, **values)
+
+    assert isinstance(report, calculations.CalculationReport)
+    assert report.result == calculations.calculate(expr, **values)
+    assert report.value == expected_value
+    assert str(report.uncertainty_expr) == expected_uncertainty
+    assert str(report) == (
+        f"f(...) = {calculations.parse_expr(expr)}\n\t-> {expected_value}\n"
+        f"δf(...) = {expected_uncertainty}\n\t-> {report.uncertainty}\n"
+    )
+    assert report.pretty is report.pretty
+
+
+@pytest.mark.parametrize(
+    "values",
+    (
+        {"y": Val(3, 3), "x": Val(3, 0.1), "z": 4},
+        {"y": [Val(3, 3), Val(5, 1)], "x": Val(3, 0.1), "z": [4, 5]},
+        {"y": [Val(3, 3), [Val(5, 1)]], "x": Val(3, 0.1), "z": 4},
+        {"y": Val(np.array([3.0, 5.0]), np.array([3.0, 1.0])), "x": Val(3, 0.1), "z": 4},
+    ),
+)
+def test_calculate_report_derived_once(values: Dict[str, IterableValOrReal], monkeypatch):
+    """Tests that a report reuses the uncertainty equation derived for its calculation"""
+    uncertainty = calculations.uncertainty
+    calls = []
+    monkeypatch.setattr(calculations, "uncertainty", lambda *args: calls.append(args) or uncertainty(*args))
+    calculations._sorted_uncertainty_expr.cache_clear()  # pylint: disable=W0212
+    calculations._uncertainty_function.cache_clear()  # pylint: disable=W0212
+
+    report = calculations.calculate("x*y+z", report=True, **values)
+    assert str(report.uncertainty_expr) == "sqrt(x**2*δy**2 + y**2*δx**2)"
+    assert len(calls) == 1
+
+
+def test_calculate_report_generator():
+    """Tests that the uncertain values of a report are found from values which can only be iterated over once"""
+    report = calculations.calculate("x*y", x=(Val(i, 0.1) for i in (1, 2)), y=2, report=True)
+
+    assert report.variables == ("x",)
+    assert str(report.uncertainty_expr) == "sqrt(y**2*δx**2)"
+    assert report.value == [2.0, 4.0]
+
+
+def test_calculate_report_correlation():
+    """Tests that the uncertainty equation of a report includes the correlations between values"""
+    report = calculations.calculate(
+        "x-y", x=Val(3, 0.1), y=Val(1, 0.1), correlation=(("x", "y"), [[1, 0.5], [0.5, 1]]), report=True
+    )
+
+    assert str(report.uncertainty_expr) == "sqrt(δx**2 - 2*δx*δy*ρ_x,y + δy**2)"
+    assert "\\delta x" in report.latex and "\\rho_{x,y}" in report.latex
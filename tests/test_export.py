@@ -0,0 +1,66 @@
+import importlib.util
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+import numpy as np
+import pytest
+
+from pycertainties import calculations, export
+from pycertainties.val import Val
+
+
+def _import(path, name: str):
+    """Imports a module from a path"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+@pytest.mark.parametrize(
+    "expr, variables, values",
+    (
+        ("x*y+z", ("x", "y"), {"x": Val(3, 0.1), "y": Val(3, 3), "z": 4}),
+        ("log(x)*sin(x*y)**2", ("x",), {"x": Val(np.array([1605.0, 20.0]), np.array([53.0, 1.0])), "y": 0.5}),
+        ("x**y/sqrt(x)", ("x", "y"), {"x": Val(10, 3), "y": Val(np.array([[2.0], [3.0]]), np.array([[1.0], [0.5]]))}),
+        ("Abs(x)*y + Min(x, 3) + Max(y, 2)", ("y",), {"x": -2, "y": Val(np.array([1.0, 3.0]), np.array([0.1, 0.2]))}),
+    ),
+)
+def test_export_module(expr: str, variables: Tuple[str], values: Dict[str, Val], tmp_path):
+    """Tests that exported modules calculate the same values and uncertainties as calculate"""
+    path = tmp_path / "exported.py"
+    export.export_module(expr, *variables, path=path)
+    module = _import(path, "exported")
+
+    arguments = {key: value.value if isinstance(value, Val) else value for key, value in values.items()}
+    arguments.update({"δ" + key: value.uncertainty for key, value in values.items() if isinstance(value, Val)})
+    value, uncertainty = module.calculate(**arguments)
+    expected = calculations.calculate(expr, **values)
+
+    np.testing.assert_allclose(value, expected.value)  # type: ignore
+    np.testing.assert_allclose(uncertainty, expected.uncertainty)  # type: ignore
+
+
+def test_export_module_without_sympy(tmp_path):
+    """Tests that exported modules can be imported and used without importing sympy"""
+    export.export_module("x*y+z", "x", "y", path=tmp_path / "exported.py")
+    code = "import sys, exported; exported.calculate(3, 3, 4, 0.1, 1); assert 'sympy' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], cwd=tmp_path, check=True)
+
+
+def test_export_module_symbol_names(tmp_path):
+    """Tests that symbols with the same names as the module's functions or numpy don't shadow them"""
+    export.export_module("value*x + numpy + sqrt(uncertainty)*pi", "x", path=tmp_path / "exported.py")
+    module = _import(tmp_path / "exported.py", "exported")
+
+    value, uncertainty = module.calculate(numpy=1, uncertainty=4, value=2, x=3, δx=0.1)
+    assert value == pytest.approx(7 + 2 * np.pi)
+    assert uncertainty == pytest.approx(0.2)
+    assert module.value(numpy=1, uncertainty=4, value=2, x=3) == value
+
+
+def test_export_module_reserved_names():
+    """Tests that symbols starting with an underscore raise an error"""
+    with pytest.raises(ValueError):
+        export.export_module("_value*x", "x")
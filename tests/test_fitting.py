@@ -0,0 +1,77 @@
+import mpmath
+import numpy as np
+import pytest
+
+from pycertainties import fitting
+from pycertainties.val import Val
+from tests.utilities import assert_approx
+
+
+@pytest.mark.parametrize("degree", (1, 2, 3))
+def test_polyfit(degree: int):
+    """Tests that batched fits match weighted fits of each series with np.polyfit"""
+    rng = np.random.default_rng(0)
+    x = np.linspace(-1, 2, 12)
+    values = rng.normal(size=(4, 3, 12))
+    uncertainties = rng.uniform(0.1, 1, size=(4, 3, 12))
+    result = fitting.polyfit(x, Val(values, uncertainties), degree)
+
+    assert result.parameters.value.shape == (4, 3, degree + 1)
+    assert result.degrees_of_freedom == 12 - degree - 1
+    for ind in np.ndindex(4, 3):
+        parameters, covariance = np.polyfit(x, values[ind], degree, w=1 / uncertainties[ind], cov="unscaled")
+        residuals = (values[ind] - np.polyval(parameters, x)) / uncertainties[ind]
+        np.testing.assert_allclose(result.parameters.value[ind], parameters)
+        np.testing.assert_allclose(result.parameters.uncertainty[ind], np.sqrt(np.diag(covariance)))
+        np.testing.assert_allclose(result.covariance[ind], covariance)
+        assert result.chi_squared[ind] == pytest.approx((residuals ** 2).sum())
+
+
+def test_polyfit_vals():
+    """Tests that arrays of Vals can be fit and that the fit can be evaluated"""
+    result = fitting.polyfit([0, 1, 2], [Val(1, 1), Val(3, 1), Val(5, 1)], 1)
+    np.testing.assert_allclose(result.parameters.value, [2, 1])
+    np.testing.assert_allclose(result.parameters.uncertainty, [np.sqrt(1 / 2), np.sqrt(5 / 6)])
+    assert result.chi_squared == pytest.approx(0)
+
+    evaluated = result.evaluate([3])
+    assert_approx(Val(evaluated.value[0], evaluated.uncertainty[0]), Val(7, np.sqrt(7 / 3)))
+
+
+@pytest.mark.parametrize("start, stop, degree", ((1e5, 1e5 + 1000, 3), (2000, 3000, 6)))
+def test_polyfit_offset(start: float, stop: float, degree: int):
+    """Tests that fits of points far from x = 0 are accurate, checking the covariance with high precision arithmetic"""
+    rng = np.random.default_rng(0)
+    x = np.linspace(start, stop, 50)
+    uncertainties = rng.uniform(0.5, 2, 50)
+    values = np.polyval(np.polyfit(x, np.sin(x / 300), degree), x) + rng.normal(scale=uncertainties)
+    result = fitting.polyfit(x, Val(values, uncertainties), degree)
+
+    parameters = np.polyfit(x, values, degree, w=1 / uncertainties)
+    residuals = (values - np.polyval(parameters, x)) / uncertainties
+    np.testing.assert_allclose(result.parameters.value, parameters, rtol=1e-6)
+    assert result.chi_squared == pytest.approx((residuals ** 2).sum())
+
+    with mpmath.workdps(60):
+        vandermonde = mpmath.matrix(
+            [
+                [mpmath.mpf(value) ** power / dvalue for power in range(degree, -1, -1)]
+                for value, dvalue in zip(x, uncertainties)
+            ]
+        )
+        covariance = (vandermonde.T * vandermonde) ** -1
+        expected = [float(covariance[i, j]) for i in range(degree + 1) for j in range(degree + 1)]
+    np.testing.assert_allclose(result.covariance.ravel(), expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "x, y, degree",
+    (
+        ([0, 1, 2], [Val(1, 1), Val(3, 0), Val(5, 1)], 1),
+        ([0, 1], [Val(1, 1), Val(3, 1)], 2),
+    ),
+)
+def test_polyfit_invalid(x, y, degree: int):
+    """Tests that series without positive uncertainties or with too few points raise an error"""
+    with pytest.raises(ValueError):
+        fitting.polyfit(x, y, degree)
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from pycertainties import strings
@@ -23,3 +24,33 @@ from pycertainties.val import Real
 def test_uncertainty_str(value: Real, uncertainty: Real, result: str):
     """Tests that string representions of values and uncertainties are correct"""
     assert strings.uncertainty_str(value, uncertainty) == result
+
+
+def test_uncertainty_strs():
+    """Tests that vectorized string representations are the same as those of uncertainty_str"""
+    values = [321.8, -321.856, -32.1856, 3.21856e-10, 3.21856e10, 0.02094495456, 3559.8838983606497]
+    uncertainties = [0.0324, 11.34, 1.134, 3.24e-12, 1.24e8, 9.341774545e-05, 21.815841616631992]
+    assert strings.uncertainty_strs(values, uncertainties).tolist() == [
+        "321.80 ± 0.03",
+        "-322 ± 11",
+        "-32.2 ± 1.1",
+        "(3.22 ± 0.03)e-10",
+        "(3.219 ± 0.012)e10",
+        "0.02094 ± 0.00009",
+        "3560 ± 20",
+    ]
+
+
+def test_uncertainty_strs_random():
+    """Tests that vectorized string representations match uncertainty_str over many magnitudes and near-ties"""
+    rng = np.random.default_rng(0)
+    values = rng.uniform(-10, 10, 5000) * 10.0 ** rng.integers(-12, 12, 5000)
+    uncertainties = np.abs(values) * 10.0 ** rng.uniform(-8, 1, 5000)
+    uncertainties[::5] = rng.integers(1, 200, 1000) / 2 * 10.0 ** rng.integers(-12, 12, 1000)
+
+    result = strings.uncertainty_strs(values.reshape(50, 100), uncertainties.reshape(50, 100))
+    assert result.shape == (50, 100)
+    expected = [
+        strings.uncertainty_str(value, dvalue) for value, dvalue in zip(values.tolist(), uncertainties.tolist())
+    ]
+    assert result.ravel().tolist() == expected
@@ -0,0 +1,92 @@
+import io
+
+import numpy as np
+import pytest
+
+from pycertainties import tables
+from pycertainties.val import Val
+
+EXPECTED_CSV = """
+n,f(x)
+1,321.80 ± 0.03
+"2, 3",(3.22 ± 0.03)e-10
+"""
+
+EXPECTED_LATEX = r"""
+\begin{tabular}{cc}
+\hline
+n & f(x) \\
+\hline
+1 & $321.80 \pm 0.03$ \\
+2, 3 & $(3.22 \pm 0.03) \times 10^{-10}$ \\
+\hline
+\end{tabular}
+"""
+
+EXPECTED_MARKDOWN = """
+| n | f(x) |
+| --- | --- |
+| 1 | 321.80 ± 0.03 |
+| 2, 3 | (3.22 ± 0.03)e-10 |
+"""
+
+
+@pytest.mark.parametrize(
+    "column",
+    (
+        [Val(321.8, 0.0324), Val(3.21856e-10, 3.24e-12)],
+        (np.array([321.8, 3.21856e-10]), np.array([0.0324, 3.24e-12])),
+        Val(np.array([321.8, 3.21856e-10]), np.array([0.0324, 3.24e-12])),
+    ),
+)
+@pytest.mark.parametrize(
+    "table_format, expected",
+    (("csv", EXPECTED_CSV), ("latex", EXPECTED_LATEX), ("markdown", EXPECTED_MARKDOWN)),
+)
+def test_write_table(column, table_format: str, expected: str):
+    """Tests that tables of Vals and other objects are written correctly in each format"""
+    file = io.StringIO(newline="")
+    tables.write_table(file, {"n": iter([1, "2, 3"]), "f(x)": column}, table_format, batch_size=1)
+    assert file.getvalue().replace("\r\n", "\n") == expected.lstrip("\n")
+
+
+def test_write_table_batches():
+    """Tests that tables are written the same regardless of batch size"""
+    values = np.linspace(-1000, 1000, 101)
+    uncertainties = np.linspace(0.01, 10, 101)
+    results = []
+    for batch_size in (1, 7, 1000):
+        file = io.StringIO()
+        tables.write_table(file, {"i": range(101), "v": (values, uncertainties)}, "markdown", batch_size)
+        results.append(file.getvalue())
+    assert results[0] == results[1] == results[2]
+
+
+def test_write_table_mixed_column():
+    """Tests that Vals in columns also holding other objects are written as Vals regardless of batch size"""
+    column = [Val(1, 0.1), "n/a", Val(2, 0.1)]
+    for batch_size in (1, 10):
+        file = io.StringIO()
+        tables.write_table(file, {"x": column}, "latex", batch_size)
+        assert file.getvalue().splitlines()[4:7] == ["$1.00 \\pm 0.10$ \\\\", "n/a \\\\", "$2.00 \\pm 0.10$ \\\\"]
+
+
+@pytest.mark.parametrize(
+    "column, expected",
+    (
+        ((Val(1, 0.1), Val(2, 0.1), Val(3, 0.1)), ["1.00 ± 0.10", "2.00 ± 0.10", "3.00 ± 0.10"]),
+        ((1, 2), ["1", "2"]),
+        ((np.array([1, 2]), [0.1, 0.1]), ["[1 2]", '"[0.1, 0.1]"']),
+    ),
+)
+def test_write_table_tuple_column(column, expected):
+    """Tests that tuples other than a pair of value and uncertainty arrays are written as one row per item"""
+    file = io.StringIO(newline="")
+    tables.write_table(file, {"x": column})
+    assert file.getvalue().splitlines()[1:] == expected
+
+
+def test_write_table_mismatch():
+    """Tests that columns of different lengths raise an error"""
+    with pytest.raises(ValueError):
+        tables.write_table(io.StringIO(), {"a": [Val(1, 0.1), Val(2, 0.1)], "b": (np.ones(3), np.ones(3))})
@@ -43,6 +43,29 @@ def test_from_val_array(val_array: np.ndarray, expected_values: np.ndarray, expe
         assert (values[ind], uncertainties[ind]) == pytest.approx((expected_values[ind], expected_uncertainties[ind]))
 
 
+@pytest.mark.parametrize(
+    "dtype, uncertainty_dtype, expected_uncertainty_dtype",
+    (
+        (np.float32, None, np.float32),
+        (np.float64, np.float32, np.float32),
+        (None, np.float32, np.float32),
+    ),
+)
+def test_val_array_dtypes(dtype, uncertainty_dtype, expected_uncertainty_dtype):
+    """Tests that Val arrays can be converted to and from value and uncertainty arrays of specific dtypes"""
+    values, uncertainties = np.array([[1.0, 2.0], [3.0, 4.0]]), np.array([[0.1, 0.2], [0.3, 0.4]])
+    val_array = utilities.to_val_array(values, uncertainties, dtype, uncertainty_dtype)
+    assert val_array[0, 1].uncertainty.dtype == expected_uncertainty_dtype
+    if dtype is not None:
+        assert val_array[0, 1].value.dtype == dtype
+
+    result_values, result_uncertainties = utilities.from_val_array(val_array, np.float64, np.float32)
+    assert result_values.dtype == np.float64
+    assert result_uncertainties.dtype == np.float32
+    np.testing.assert_allclose(result_values, values)
+    np.testing.assert_allclose(result_uncertainties, uncertainties, rtol=1e-6)
+
+
 @pytest.mark.parametrize(
     "function, iterables, expected",
     (
@@ -63,6 +86,40 @@ def test_operate_recursive(function, iterables, expected):
         assert_approx(got, ex)
 
 
+@pytest.mark.parametrize(
+    "function, iterables, expected",
+    (
+        (
+            lambda *lists: [sum(items) for items in zip(*lists)],
+            (
+                [1, 2, 3, [4, 5, 6, [7, 8], 9], 10],
+                [10, 20, 30, [40, 50, 60, [70, 80], 90], 100],
+                [100, 200, 300, [400, 500, 600, [700, 800], 900], 1000],
+            ),
+            [111, 222, 333, [444, 555, 666, [777, 888], 999], 1110],
+        ),
+    ),
+)
+def test_operate_flat(function, iterables, expected):
+    """Tests that a function called once with the flattened iterables gives the same results as operate_recursive"""
+    result = utilities.operate_flat(function, *iterables)
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "iterables",
+    (
+        ([1, 2, [3, 4]], [1, 2, [3]]),
+        ([1, 2, [3, 4]], [1, 2, 3, 4]),
+        ([1, 2], [1, 2, 3]),
+    ),
+)
+def test_operate_flat_mismatch(iterables):
+    """Tests that iterables of different shapes raise an error instead of being truncated"""
+    with pytest.raises(ValueError):
+        utilities.operate_flat(lambda *lists: lists[0], *iterables)
+
+
 @pytest.mark.parametrize(
     "values, expected",
     (
@@ -88,3 +145,127 @@ def test_weighted_average(values: Iterable[Val], expected: Val):
     res = utilities.weighted_average(values)
     print(res.value, res.uncertainty)
     assert_approx(utilities.weighted_average(values), expected)
+
+
+VAL_ARRAY = np.array([[Val(1, 0.1), Val(2, 0.2), Val(3, 0.3)], [Val(4, 0.4), Val(5, 0.5), Val(6, 0.6)]])
+
+
+@pytest.mark.parametrize("values", (VAL_ARRAY, Val(*utilities.from_val_array(VAL_ARRAY))))
+@pytest.mark.parametrize("axis", (None, 0, 1))
+def test_val_sum(values, axis):
+    """Tests that arrays of Vals are summed the same as by repeated addition"""
+    result = utilities.val_sum(values, axis)
+    expected = VAL_ARRAY.sum(axis=axis)
+    for ind in np.ndindex(np.shape(expected)):
+        assert_approx(
+            Val(np.asarray(result.value)[ind], np.asarray(result.uncertainty)[ind]), np.asarray(expected)[ind]
+        )
+
+
+def test_val_sum_float32_uncertainties():
+    """Tests that small uncertainties stored as np.float32 don't underflow to 0 when summed"""
+    values = Val(np.ones(3), np.full(3, 1e-24)).astype(np.float64, np.float32)
+    result = utilities.val_sum(values)
+    assert result.value == 3
+    assert result.uncertainty == pytest.approx(np.sqrt(3) * 1e-24)
+
+
+@pytest.mark.parametrize("axis", (None, 0, 1))
+def test_val_mean(axis):
+    """Tests that arrays of Vals are averaged the same as by repeated addition and division"""
+    result = utilities.val_mean(VAL_ARRAY, axis)
+    expected = VAL_ARRAY.sum(axis=axis) / (VAL_ARRAY.size if axis is None else VAL_ARRAY.shape[axis])
+    for ind in np.ndindex(np.shape(expected)):
+        assert_approx(
+            Val(np.asarray(result.value)[ind], np.asarray(result.uncertainty)[ind]), np.asarray(expected)[ind]
+        )
+
+
+@pytest.mark.parametrize("axis", (0, 1))
+def test_val_cumsum(axis):
+    """Tests that cumulative sums of arrays of Vals are the same as by repeated addition"""
+    result = utilities.val_cumsum(VAL_ARRAY, axis)
+    expected = np.cumsum(VAL_ARRAY, axis=axis)
+    for ind in np.ndindex(expected.shape):
+        assert_approx(Val(result.value[ind], result.uncertainty[ind]), expected[ind])
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    (
+        (VAL_ARRAY[0], np.array([1.0, 2.0, 3.0])),
+        (VAL_ARRAY, VAL_ARRAY.T),
+        (np.array([[1.0, 2.0]]), VAL_ARRAY),
+    ),
+)
+def test_val_dot_matmul(a, b):
+    """Tests that products of arrays of Vals are the same as by repeated multiplication and addition"""
+    expected = np.dot(a, b)
+    for function in (utilities.val_dot, utilities.val_matmul):
+        result = function(a, b)
+        for ind in np.ndindex(np.shape(expected)):
+            assert_approx(
+                Val(np.asarray(result.value)[ind], np.asarray(result.uncertainty)[ind]), np.asarray(expected)[ind]
+            )
+
+
+@pytest.mark.parametrize(
+    "ufunc, arrays",
+    (
+        (np.exp, (VAL_ARRAY,)),
+        (np.sqrt, (np.array([Val(4, 0.1), 2, 9]),)),
+        (np.hypot, (VAL_ARRAY, np.array([1.0, 2.0, 3.0]))),
+        (np.arctan2, (VAL_ARRAY[0], Val(*utilities.from_val_array(VAL_ARRAY)))),
+    ),
+)
+def test_val_ufunc(ufunc, arrays):
+    """Tests that ufuncs of arrays of Vals are the same as the ufunc of each Val"""
+    result = utilities.val_ufunc(ufunc, *arrays)
+    expected = ufunc(*(utilities.to_val_array(*utilities.split_vals(array)) for array in arrays))
+    for ind in np.ndindex(np.shape(expected)):
+        assert_approx(Val(result.value[ind], result.uncertainty[ind]), expected[ind])
+
+
+def test_val_ufunc_exact_infinite_derivative():
+    """Tests that int/floats where a ufunc's derivative is infinite have no uncertainty rather than nan"""
+    result = utilities.val_ufunc(np.sqrt, [Val(4, 0.1), 0])
+    assert list(result.value) == [2, 0]
+    assert list(result.uncertainty) == pytest.approx([0.025, 0])
+
+
+def test_val_ufunc_unsupported():
+    """Tests that ufuncs without derivatives for Vals raise a ValueError"""
+    with pytest.raises(ValueError):
+        utilities.val_ufunc(np.floor, VAL_ARRAY)
+
+
+@pytest.mark.parametrize(
+    "values, keys",
+    (
+        (
+            np.array([Val(1, 0.1), Val(3, 0.1), Val(2, 0.01), Val(100, 50), Val(3, 0.2), Val(4, 1), Val(6, 1)]),
+            np.array([2, 2, 2, 2, 2, 0, 0]),
+        ),
+        (
+            Val(np.array([[5.0, 6.0], [7.0, 4.0]]), np.array([[1.0, 2.0], [1.0, 0.5]])),
+            np.array([["b", "a"], ["b", "a"]]),
+        ),
+    ),
+)
+def test_grouped_weighted_average(values, keys):
+    """Tests that grouped weighted averages match the weighted average of each group"""
+    unique_keys, result = utilities.grouped_weighted_average(values, keys)
+    assert list(unique_keys) == sorted(set(keys.ravel().tolist()))
+
+    split_values, split_uncertainties = (
+        (values.value, values.uncertainty) if isinstance(values, Val) else utilities.from_val_array(values)
+    )
+    for index, key in enumerate(unique_keys):
+        group = utilities.to_val_array(split_values[keys == key], split_uncertainties[keys == key])
+        assert_approx(Val(result.value[index], result.uncertainty[index]), utilities.weighted_average(group))
+
+
+def test_grouped_weighted_average_mismatch():
+    """Tests that keys of a different shape than the values raise an error"""
+    with pytest.raises(ValueError):
+        utilities.grouped_weighted_average([Val(1, 0.1), Val(2, 0.1)], [0, 1, 1])
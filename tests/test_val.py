@@ -1,9 +1,11 @@
 import dataclasses
 import math
-from typing import Union
+from typing import Tuple, Union
 
+import numpy as np
 import pytest
 
+from pycertainties.calculations import calculate
 from pycertainties.val import Real, Val
 
 
@@ -108,3 +110,120 @@ def test_sin(val: Val, expected: Val):
 def test_sqrt(val: Val, expected: Val):
     """Tests that the sqrt of Val objects can be taken"""
     assert dataclasses.astuple(val.sqrt()) == pytest.approx(dataclasses.astuple(expected))
+
+
+@pytest.mark.parametrize(
+    "val, dtype, uncertainty_dtype",
+    (
+        (Val(10.5, 0.25), np.float32, None),
+        (Val(np.array([1.0, 2.0]), np.array([0.5, 0.25])), np.float64, np.float32),
+    ),
+)
+def test_astype(val: Val, dtype, uncertainty_dtype):
+    """Tests that the storage type of a Val's value and uncertainty can be changed"""
+    result = val.astype(dtype, uncertainty_dtype)
+    assert result.value.dtype == dtype
+    assert result.uncertainty.dtype == (uncertainty_dtype or dtype)
+    assert np.all(result.value == val.value)
+    assert np.all(result.uncertainty == val.uncertainty)
+
+
+@pytest.mark.parametrize(
+    "val",
+    (
+        Val(1e-10, 1e-24).astype(np.float32),
+        Val(np.array([1.0, 2.0]), np.array([1e-24, 2e-24])).astype(np.float64, np.float32),
+    ),
+)
+def test_astype_small_uncertainty(val: Val):
+    """Tests that uncertainties stored as np.float32 are upcast before being squared, so they don't underflow to 0"""
+    for result, expected in (
+        (val + val, np.sqrt(2) * val.uncertainty),
+        (val - val, np.sqrt(2) * val.uncertainty),
+        (val * 2, 2 * val.uncertainty),
+        (val ** 2, 2 * val.value * val.uncertainty),
+        (val.log(), val.uncertainty / val.value),
+        (np.hypot(val, val), val.uncertainty),
+    ):
+        assert np.all(result.uncertainty > 0)
+        np.testing.assert_allclose(result.uncertainty, expected, rtol=1e-6)
+
+
+def test_str_array():
+    """Tests that Vals of arrays are converted to strings element-wise"""
+    assert str(Val(np.array([321.8, 3.21856e-10]), np.array([0.0324, 3.24e-12]))) == "[321.80 ± 0.03 (3.22 ± 0.03)e-10]"
+
+
+@pytest.mark.parametrize(
+    "ufunc, expr, values",
+    (
+        (np.negative, "-x", (Val(0.3, 0.01),)),
+        (np.absolute, "sqrt(x**2)", (Val(-0.3, 0.01),)),
+        (np.square, "x**2", (Val(-0.3, 0.01),)),
+        (np.sqrt, "sqrt(x)", (Val(0.3, 0.01),)),
+        (np.cbrt, "x**(1/3)", (Val(0.3, 0.01),)),
+        (np.exp, "exp(x)", (Val(0.3, 0.01),)),
+        (np.exp2, "2**x", (Val(0.3, 0.01),)),
+        (np.expm1, "exp(x) - 1", (Val(0.3, 0.01),)),
+        (np.log, "log(x)", (Val(0.3, 0.01),)),
+        (np.log2, "log(x, 2)", (Val(0.3, 0.01),)),
+        (np.log10, "log(x, 10)", (Val(0.3, 0.01),)),
+        (np.log1p, "log(1 + x)", (Val(0.3, 0.01),)),
+        (np.sin, "sin(x)", (Val(0.3, 0.01),)),
+        (np.cos, "cos(x)", (Val(0.3, 0.01),)),
+        (np.tan, "tan(x)", (Val(0.3, 0.01),)),
+        (np.arcsin, "asin(x)", (Val(0.3, 0.01),)),
+        (np.arccos, "acos(x)", (Val(0.3, 0.01),)),
+        (np.arctan, "atan(x)", (Val(0.3, 0.01),)),
+        (np.sinh, "sinh(x)", (Val(0.3, 0.01),)),
+        (np.cosh, "cosh(x)", (Val(0.3, 0.01),)),
+        (np.tanh, "tanh(x)", (Val(0.3, 0.01),)),
+        (np.arcsinh, "asinh(x)", (Val(0.3, 0.01),)),
+        (np.arccosh, "acosh(x)", (Val(1.3, 0.01),)),
+        (np.arctanh, "atanh(x)", (Val(0.3, 0.01),)),
+        (np.deg2rad, "x*pi/180", (Val(30, 0.5),)),
+        (np.rad2deg, "x*180/pi", (Val(0.3, 0.01),)),
+        (np.add, "x + y", (Val(0.3, 0.01), Val(1.7, 0.02))),
+        (np.subtract, "x - y", (Val(0.3, 0.01), 1.7)),
+        (np.multiply, "x * y", (0.3, Val(1.7, 0.02))),
+        (np.divide, "x / y", (Val(0.3, 0.01), Val(1.7, 0.02))),
+        (np.power, "x ** y", (Val(0.3, 0.01), Val(1.7, 0.02))),
+        (np.power, "x ** y", (Val(-2, 0.01), 3)),
+        (np.hypot, "sqrt(x**2 + y**2)", (Val(0.3, 0.01), Val(1.7, 0.02))),
+        (np.arctan2, "atan2(x, y)", (Val(0.3, 0.01), Val(-1.7, 0.02))),
+    ),
+)
+def test_ufunc(ufunc: np.ufunc, expr: str, values: Tuple[Union[Val, Real], ...]):
+    """Tests that numpy ufuncs can be used on Val objects, propagating the same uncertainty as calculate(...)"""
+    expected = calculate(expr, **dict(zip(("x", "y"), values)))
+    assert dataclasses.astuple(ufunc(*values)) == pytest.approx(dataclasses.astuple(expected))
+
+
+def test_ufunc_array():
+    """Tests that ufuncs of Vals of arrays are calculated element-wise, broadcasting against other arrays"""
+    x = Val(np.array([0.1, 0.2, 0.3]), np.array([0.01, 0.02, 0.03]))
+    result = np.hypot(x, np.array([[1.0], [2.0]]))
+
+    assert result.value.shape == result.uncertainty.shape == (2, 3)
+    for ind in np.ndindex(2, 3):
+        expected = np.hypot(Val(x.value[ind[1]], x.uncertainty[ind[1]]), ind[0] + 1.0)
+        assert (result.value[ind], result.uncertainty[ind]) == pytest.approx(dataclasses.astuple(expected))
+
+
+def test_ufunc_object_array():
+    """Tests that ufuncs of numpy arrays of Vals give arrays of the same Vals as the ufunc of each Val"""
+    vals = [Val(0.1, 0.01), Val(0.2, 0.02)]
+    array = np.array(vals)
+
+    assert list(np.exp(array)) == [np.exp(val) for val in vals]
+    assert list(np.arctan2(array, Val(2, 0.1))) == [np.arctan2(val, Val(2, 0.1)) for val in vals]
+    assert list(np.abs(array)) == [abs(val) for val in vals]
+
+
+def test_ufunc_numeric_array():
+    """Tests that numpy arrays of int/floats combined with Vals of scalers give numpy arrays of Vals"""
+    result = np.array([1.0, 2.0]) * Val(1, 0.1)
+
+    assert isinstance(result, np.ndarray) and result.dtype == object
+    assert list(result) == [Val(1, 0.1), Val(2, 0.2)]
+    assert list(np.hypot(Val(3, 0.1), np.array([4, 8]))) == [np.hypot(Val(3, 0.1), 4), np.hypot(Val(3, 0.1), 8)]